@@ -0,0 +1,131 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+#: Import-time regression benchmark, based on `python -X importtime`.
+#:
+#: Budget (the best of RUNS fresh interpreters, cumulative import time):
+#:
+#:      import hype             40 ms
+#:      import hype.ui          45 ms
+#:      import hype.prompt      45 ms
+#:
+#: The budgets include the standard modules imported on the way (typing
+#: is most of it), they can be scaled with HYPE_IMPORT_BUDGET_SCALE on a
+#: slower machine. The modules in DEFERRED must never be imported by
+#: `import hype`, they are loaded on first use.
+#:
+#: Run with:
+#:      python benchmarks/import_time.py
+
+import os
+import re
+import subprocess
+import sys
+
+RUNS = 7
+
+#: The repository, imported instead of an installed hype.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#: Module -> budget in milliseconds
+BUDGETS = {
+    "hype": 40,
+    "hype.ui": 45,
+    "hype.prompt": 45,
+}
+
+DEFERRED = (
+    "hype.app",
+    "hype.color",
+    "hype.parser",
+    "optparse",
+    "inspect",
+    "colorama",
+)
+
+LINE_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def import_times(module: str) -> list:
+    """
+    Import the module in a fresh interpreter and return the imports as
+    `(depth, name, cumulative time in microseconds)`.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import %s" % (module)],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+        cwd=ROOT,
+    )
+
+    imports = []
+
+    for line in result.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+
+        if match:
+            _, cumulative, indent, name = match.groups()
+            imports.append((len(indent), name, int(cumulative)))
+
+    return imports
+
+
+def hype_time(imports: list) -> float:
+    """
+    Return the time (in milliseconds) of the top level imports of the hype
+    packages, `hype` and `hype.ui` for `import hype.ui`. Their time includes
+    the nested imports.
+    """
+    return (
+        sum(
+            cumulative
+            for depth, name, cumulative in imports
+            if depth == 1 and name.split(".")[0] == "hype"
+        )
+        / 1000
+    )
+
+
+def main() -> int:
+    scale = float(os.environ.get("HYPE_IMPORT_BUDGET_SCALE", 1))
+    failed = False
+
+    for module, budget in BUDGETS.items():
+        best = min(hype_time(import_times(module)) for _ in range(RUNS))
+
+        print("%-12s %6.1f ms  (budget %d ms)" % (module, best, budget * scale))
+
+        if best > budget * scale:
+            failed = True
+
+    imported = set(name for _, name, _ in import_times("hype"))
+
+    for module in DEFERRED:
+        if module in imported:
+            print("`import hype` imports %s" % (module))
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+#: Benchmark of the markup tokenizer on multi-MB inputs. The inputs mix
+#: color tags with text full of brackets that are not tags (json, array
+#: dumps, IPv6 addresses). The throughput should not drop when the input
+#: grows, the script fails if it does.
+#:
+#: Run with:
+#:      python benchmarks/markup.py
+
+import json
+import os
+import sys
+import time
+
+#: Run from a checkout, the script directory is on the path, not the repo.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hype.color import render_color
+from hype.color import tokenize_tag
+
+#: The input sizes in MB
+SIZES = (1, 2, 4, 8)
+
+#: The maximum slowdown of the throughput between the smallest and
+#: the largest input.
+MAX_SLOWDOWN = 2.0
+
+SAMPLES = {
+    "markup": "[green]OK[/green] [b]build[/b] finished in [yellow]12s[/yellow]\n",
+    "json": json.dumps({"ids": list(range(20)), "tags": [["a", "b"], []]}) + "\n",
+    "ipv6": "connect [::1]:8080 [fe80::1%lo0] [2001:db8::ff00:42:8329]\n",
+}
+
+
+def make_input(sample: str, size: int) -> str:
+    return sample * (size * 1024 * 1024 // len(sample))
+
+
+def measure(func, text: str) -> float:
+    start = time.perf_counter()
+    func(text)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    failed = False
+
+    for name, sample in SAMPLES.items():
+        rates = []
+
+        for size in SIZES:
+            text = make_input(sample, size)
+            tokens = measure(lambda t: sum(1 for _ in tokenize_tag(t)), text)
+            render = measure(render_color, text)
+            rates.append(size / render)
+
+            print(
+                "%-7s %2d MB  tokenize %6.3fs  render %6.3fs  %6.1f MB/s"
+                % (name, size, tokens, render, size / render)
+            )
+
+        if rates[0] / rates[-1] > MAX_SLOWDOWN:
+            print("%s: the throughput is not linear" % (name))
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
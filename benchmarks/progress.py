@@ -0,0 +1,127 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+#: Per-call overhead of the progress bar handle, against a bare loop.
+#:
+#: Budget (the best of RUNS loops of ITEMS items, bar not rendered):
+#:
+#:      bar() in the fast mode      MAX_FAST_OVERHEAD ns per item
+#:
+#: The default bar() is measured too, for comparison only. The bar is
+#: not rendered while measuring (no terminal), so only the cost of the
+#: calls is measured. Needs the `progress` plugin (alive-progress).
+#:
+#: Run with:
+#:      python benchmarks/progress.py
+
+from contextlib import contextmanager
+import io
+import os
+import sys
+import time
+
+#: Run from a checkout, the script directory is on the path, not the repo.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hype.ui import progressbar
+
+ITEMS = 1000000
+RUNS = 5
+
+#: Nanoseconds per item added by bar() in the fast mode.
+MAX_FAST_OVERHEAD = 150
+
+
+def bare_loop() -> float:
+    start = time.perf_counter()
+
+    for _ in range(ITEMS):
+        pass
+
+    return time.perf_counter() - start
+
+
+@contextmanager
+def discard_output():
+    """
+    Send the output of the bars (including the cursor codes) to a
+    throwaway stream, so the report is the only output.
+    """
+    stdout = sys.stdout, sys.__stdout__
+    sys.stdout = sys.__stdout__ = io.StringIO()
+
+    try:
+        yield
+
+    finally:
+        sys.stdout, sys.__stdout__ = stdout
+
+
+def bar_loop(**options) -> float:
+    with discard_output(), progressbar(ITEMS, **options) as bar:
+        start = time.perf_counter()
+
+        for _ in range(ITEMS):
+            bar()
+
+        return time.perf_counter() - start
+
+
+def batched_loop(batch: int = 1000) -> float:
+    with discard_output(), progressbar(ITEMS, fast=True) as bar:
+        advance_many = bar.advance_many
+        start = time.perf_counter()
+
+        for _ in range(ITEMS // batch):
+            for _ in range(batch):
+                pass
+
+            advance_many(batch)
+
+        return time.perf_counter() - start
+
+
+def per_item(elapsed: float, bare: float) -> float:
+    """
+    Return the overhead in nanoseconds per item.
+    """
+    return max(0.0, elapsed - bare) / ITEMS * 1e9
+
+
+def main() -> int:
+    bare = min(bare_loop() for _ in range(RUNS))
+    default = min(bar_loop() for _ in range(RUNS))
+    fast = min(bar_loop(fast=True) for _ in range(RUNS))
+    batched = min(batched_loop() for _ in range(RUNS))
+
+    print("bare loop        %6.1f ns/item" % (bare / ITEMS * 1e9))
+    print("bar()            %+6.1f ns/item" % (per_item(default, bare)))
+    print(
+        "bar() fast       %+6.1f ns/item  (budget %d ns)"
+        % (per_item(fast, bare), MAX_FAST_OVERHEAD)
+    )
+    print("advance_many()   %+6.1f ns/item" % (per_item(batched, bare)))
+
+    return 1 if per_item(fast, bare) > MAX_FAST_OVERHEAD else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,10 +19,18 @@
 # THE SOFTWARE.
 
 
-from .app import Hype
+from .lazy import lazy_attributes
 from .print import print
-from .cursor import hide as hide_cursor
-from .cursor import show as show_cursor
+
+#: The other names are imported on first access.
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Hype": ".app",
+        "hide_cursor": ".cursor:hide",
+        "show_cursor": ".cursor:show",
+    },
+)
 
 __all__ = ["Hype", "print", "hide_cursor", "show_cursor"]
 
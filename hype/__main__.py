@@ -0,0 +1,66 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+#: Command line tools of hype. Usage: `python -m hype COMMAND [ARGS..]`
+
+from typing import List
+from typing import Optional
+
+from hype.command import HypeArgument
+from hype.command import HypeCommand
+from hype.parser import HypeParser
+from hype.utils import import_string
+
+
+def main(argv: Optional[List[str]] = None):
+    build_manifest = HypeCommand(
+        "build-manifest",
+        help="Write the command manifest of a Hype application.",
+    )
+    build_manifest.add_option(
+        "-o",
+        "--output",
+        dest="output",
+        default="hype.manifest",
+        metavar="PATH",
+        help="The path of the manifest file. Default: hype.manifest",
+    )
+    build_manifest.parser.add_argument(
+        HypeArgument("app", help="The import path of the application: package.module:app")
+    )
+
+    build_manifest.parser.enable_interspersed_args()
+
+    parser = HypeParser([build_manifest], prog="hype")
+    options, command, command_opt, command_args = parser.parse_args(argv)
+
+    if command is build_manifest:
+        if len(command_args) != 1:
+            parser.error("build-manifest expects the import path of the application")
+
+        app = import_string(command_args[0])
+        app.dump_manifest(
+            command_opt.output, modules=[command_args[0].partition(":")[0]]
+        )
+        print("Manifest written to %s" % (command_opt.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -19,34 +19,57 @@
 # THE SOFTWARE.
 
 
+import contextlib
 import functools
 import inspect
+import io
+import os
 import sys
 
 from typing import List, Optional
 from typing import Any
 from typing import Callable
+from typing import IO
+from typing import Iterable
 from typing import Tuple
 from typing import get_type_hints
 
 from .command import HypeCommand
 from .command import HypeArgument
+from .parser import HypeGroup
 from .parser import HypeParser
+from .native import NativeCommand
 
 from .print import print as _print
+from .print import Buffer
 
 from .constants import rule_colors
 from .constants import bg_colors
 from .style import Background
 
 from .utils import CommandDict
+from .utils import ArgumentDict
 from .utils import ParamOption
 from .utils import OptionDict
 from .utils import create_bool_option
 from .utils import convert_param_to_option
-from .utils import convert_option_to_string
+from .utils import import_string
+from .utils import InvokeResult
+
+from .completion import COMPLETE_VAR
+from .completion import complete
+
+from .help import HelpStore
+
+from .manifest import dump_option
+from .manifest import get_sources
+from .manifest import get_target
+from .manifest import load_option
+from .manifest import read_manifest
+from .manifest import write_manifest
 
 from .errors import ColorNotFound
+from .errors import CommandConflict
 
 
 class Hype:
@@ -54,7 +77,16 @@ class Hype:
     The main application for the CLI.
 
     Parameters:
-        -
+        engine (str):
+            The parser engine of the commands. `optparse` (default) or
+            `native`, a single pass parser compiled from the signature of
+            the command. The help is rendered by optparse on both engines.
+
+        help_cache (str):
+            The path of a file where the rendered help is kept between runs.
+            A help is only reused for the same commands, options and help
+            strings, and the file is discarded when a source file of the
+            application is modified.
 
     Example:
 
@@ -68,17 +100,49 @@ class Hype:
 
     """
 
-    __commands = {}
-    __required_commands = []
-    __commands_function = {}
-    __registered_args = {}
-    __registered_args_func = {}
-    __command_names = []
+    def __init__(
+        self, engine: Optional[str] = "optparse", help_cache: Optional[str] = None
+    ):
+
+        if engine not in ("optparse", "native"):
+            raise ValueError("{} is not a supported parser engine".format(engine))
 
-    def __init__(self):
+        #: The parser engine of the commands
+        self.__engine = engine
+
+        #: The registered commands and groups by their key (`group name`)
+        self.__commands = {}
+        self.__groups = {}
+
+        #: (group, command name or alias) -> the name of the command or group
+        self.__names = {}
+
+        #: The arguments registered by `argument`, by function.
+        self.__arguments = {}
+
+        #: The persistent store of the rendered help
+        self.__help_store = (
+            HelpStore(help_cache, lambda: get_sources(self.__modules()))
+            if help_cache
+            else None
+        )
 
         #: The parser object to be used
-        self.__parser = HypeParser()
+        self.__parser = HypeParser(help_store=self.__help_store)
+
+        #: The compiled dispatch table (command name -> HypeCommand).
+        #: It is built once on the first `run` and the option parser of
+        #: each command is only built when the command is selected.
+        self.__dispatch = None
+
+        #: The compiled HypeCommand (or HypeGroup) to its registry key.
+        self.__keys = {}
+
+        #: The registry keys of the commands and groups of each group.
+        self.__members = {}
+
+        #: The custom help registered by `help` and its aliases.
+        self.__help = None
 
     @property
     def commands(self):
@@ -86,10 +150,8 @@ class Hype:
         All command registered. Return by it's name.
         """
         command_list = []
-        for k in self.__commands.keys():
-            command_list.append(
-                {self.__commands[k]["name"]: self.__commands[k]["help"]}
-            )
+        for command in self.__commands.values():
+            command_list.append({command.name: command.help})
 
         return command_list
 
@@ -134,16 +196,50 @@ class Hype:
 
         """
 
+        _print(self.__format_echo(text, options))
+
+    def echo_many(self, texts: Iterable[Any], **options):
+        """
+        Like `echo` for each text, but the texts are written at once (see
+        `hype.print.Buffer`) instead of one write per text.
+
+        Parameters:
+        ---
+            texts (Iterable):
+                The values to be printed.
+
+            **options(dict):
+                The options of `echo` and `max_size`, `max_delay` of the buffer.
+
+        Example:
+        ---
+
+            >>> app = Hype()
+            >>> app.echo_many('[green]OK[/green] %s' % (name) for name in files)
+
+        """
+
+        with Buffer(
+            max_size=options.get("max_size", 64 * 1024),
+            max_delay=options.get("max_delay"),
+        ) as buffer:
+            for text in texts:
+                buffer.print(self.__format_echo(text, options))
+
+    def __format_echo(self, text: Any, options: dict) -> Any:
+        """
+        Add the background of the echo options to the text.
+        """
+
         background = options.get("background") or None
 
         if background in bg_colors:
-            _print("%s%s%s" % (bg_colors[background], text, bg_colors["reset"]))
+            return "%s%s%s" % (bg_colors[background], text, bg_colors["reset"])
 
         elif background not in bg_colors and background != None:
             raise ColorNotFound("%s is not yet supported." % (background))
 
-        else:
-            _print(text)
+        return text
 
     def command(
         self,
@@ -152,6 +248,7 @@ class Hype:
         aliases: Optional[Tuple[Any]] = (),
         help: Optional[str] = "",
         func: Optional[Callable[..., Any]] = None,
+        group: Optional[str] = None,
     ):
 
         """
@@ -170,6 +267,13 @@ class Hype:
             help (str):
                 The help format of the command.
 
+            group (str):
+                The path of the group of the command, for example: `db migrate`.
+                Usually set by `CommandGroup.command`
+
+        Raises `CommandConflict` if the name or one of the aliases is
+        already registered in the group.
+
         Example:
 
             >>> @app.command()
@@ -197,80 +301,429 @@ class Hype:
             #: Replace the _ to -
             _name = _name.replace("_", "-")
 
+            #: The key of the command in the registry
+            _key = "%s %s" % (group, _name) if group else _name
+
             #: Set the help of the command
             _help = help or func.__doc__.strip() if func.__doc__ else "This command accept option"
 
-            #: The signature of the function
-            signature = inspect.signature(func)
+            placeholder = self.__commands.get(_key)
 
-            #: Type hints of the function
-            type_hints = func.__annotations__
+            if placeholder and placeholder.func is None:
+                try:
+                    target = get_target(func)
 
-            #: Set the params to none dict. It should contain the param of the function
-            #: and the type hints of the parameters
-            params = []
-            rargs_keys = {}
+                except ValueError:
+                    target = None
 
-            for k, v in self.__registered_args_func.items():
-                if k.__name__ == func.__name__:
-                    rargs_keys = v
+                if target != placeholder.target:
+                    raise CommandConflict(
+                        "{} is already registered by the command {}".format(
+                            _name, placeholder.target
+                        )
+                    )
 
-                else:
-                    rargs_keys = {}
+                #: The command was registered lazily and its module is being
+                #: imported by the dispatch, only the function is missing.
+                placeholder.func = func
 
-            for param in signature.parameters.values():
-                #: The annotation of the function.
-                #: For example: def func(name: str) -> str is the annotaiton
-                annotation = param.annotation
+                return func
 
-                #: The param name of the function
-                #: For example: def func(name) -> name is the param.
-                param_name = param.name
+            self.__register_names(_name, _aliases, group)
 
-                #: Replace the _ to - for params
-                param_name = param_name.replace("_", "-")
+            options, arguments = self.__reflect(func)
 
-                if param.name in type_hints:
-                    annotation = type_hints[param.name]
+            self.__commands[_key] = CommandDict(
+                _name,
+                _usage,
+                _help,
+                _aliases,
+                options,
+                func,
+                group=group,
+                arguments=arguments,
+            )
 
-                if param.name not in rargs_keys:
-                    required = (
-                        True if param.default is inspect.Parameter.empty else False
-                    )
-                    default = (
-                        param.default
-                        if param.default is not inspect.Parameter.empty
-                        else None
-                    )
-                    anon = (
-                        annotation
-                        if annotation is not inspect.Parameter.empty
-                        else None
-                    )
+            #: A new command was registered, the dispatch table is outdated.
+            self.__invalidate()
+
+            return func
+
+        return deco(func) if func else deco
+
+    def lazy_command(
+        self,
+        name: str,
+        target: str,
+        usage: Optional[str] = None,
+        aliases: Optional[Tuple[Any]] = (),
+        help: Optional[str] = "",
+        group: Optional[str] = None,
+    ):
+        """
+        Register a command by the import path of its function. The module
+        of the function is only imported when the command is dispatched
+        (or its help is shown), so heavy dependencies of the command are
+        not loaded for the other commands.
+
+        Parameters:
+            name (str):
+                The name of the command.
+
+            target (str):
+                The import path of the function: `package.module:function`
+
+            usage (str):
+                The usage format of the command.
+
+            aliases (tuple):
+                A tuple of aliases of the command.
+
+            help (str):
+                The help format of the command.
+
+            group (str):
+                The path of the group of the command.
+
+        Raises `CommandConflict` if the name or one of the aliases is
+        already registered in the group.
+
+        Example:
+
+            >>> app.lazy_command('export', 'mycli.export:export', help='Export the data')
+
+        """
+
+        module_name, _, attribute = target.partition(":")
+
+        if not module_name or not attribute:
+            raise ValueError(
+                "{} is not a valid import path, expected `module:function`".format(
+                    target
+                )
+            )
+
+        _name = name.replace("_", "-")
+        _key = "%s %s" % (group, _name) if group else _name
+
+        self.__register_names(_name, aliases, group)
+
+        self.__commands[_key] = CommandDict(
+            _name,
+            usage,
+            help or "This command accept option",
+            aliases,
+            None,
+            None,
+            target,
+            group,
+        )
+
+        self.__invalidate()
+
+    def group(
+        self,
+        name: str,
+        usage: Optional[str] = None,
+        aliases: Optional[Tuple[Any]] = (),
+        help: Optional[str] = "",
+        group: Optional[str] = None,
+    ) -> "CommandGroup":
+        """
+        Register a group of commands. The commands of the group are
+        invoked as `GROUP COMMAND [ARGS]` and groups can be nested.
+
+        Parameters:
+            name (str):
+                The name of the group.
+
+            usage (str):
+                The usage format of the group.
 
-                    optionparam = ParamOption(
+            aliases (tuple):
+                A tuple of aliases of the group.
+
+            help (str):
+                The help format of the group.
+
+            group (str):
+                The path of the parent group. Usually set by `CommandGroup.group`
+
+        Raises `CommandConflict` if the name or one of the aliases is
+        already registered in the parent group.
+
+        Example:
+
+            >>> db = app.group('db', help='Database commands')
+            >>> migrate = db.group('migrate')
+            >>> ...
+            >>> @migrate.command()
+            >>> def up(steps: int = 1):
+            >>>     ...
+            >>> #: python app.py db migrate up --steps 2
+
+        """
+
+        _name = name.replace("_", "-")
+        _key = "%s %s" % (group, _name) if group else _name
+
+        if _key in self.__groups:
+            #: Already registered (for example by `load_manifest`)
+            return CommandGroup(self, _key)
+
+        self.__register_names(_name, aliases, group)
+
+        self.__groups[_key] = CommandDict(
+            _name,
+            usage,
+            help or "This command accept sub commands",
+            aliases,
+            group=group,
+        )
+
+        self.__invalidate()
+
+        return CommandGroup(self, _key)
+
+    def __register_names(
+        self, name: str, aliases: Optional[Tuple[Any]], group: Optional[str]
+    ):
+        """
+        Reserve the name and the aliases of a command (or group) in its
+        group. Raise `CommandConflict` if one is already used, when the
+        command is registered rather than when the application is run.
+        """
+        if isinstance(aliases, str):
+            aliases = (aliases,)
+
+        names = (name,) + tuple(aliases or ())
+
+        #: Every parser adds the built-in `help` command when it is run
+        builtin = HypeParser._HelpCommand
+        used = {
+            alias: builtin.name for alias in (builtin.name,) + builtin.aliases
+        }
+
+        if group is None:
+            #: The commands added to the parser directly, like a custom `help`
+            compiled = set(self.__dispatch.values()) if self.__dispatch else ()
+            custom = {
+                alias: command.name
+                for command in self.__parser.commands
+                if command not in compiled
+                for alias in (command.name,) + command.aliases
+            }
+
+            if "help" in custom:
+                #: The custom `help` replaces the built-in one
+                used = custom
+
+            else:
+                used.update(custom)
+
+        for alias in names:
+            owner = self.__names.get((group, alias)) or used.get(alias)
+
+            if owner is not None:
+                raise CommandConflict(
+                    "{} is already registered by the command {}".format(alias, owner)
+                )
+
+        for alias in names:
+            self.__names[(group, alias)] = name
+
+    def __reflect(
+        self, func: Callable[..., Any]
+    ) -> Tuple[List[ParamOption], List[ArgumentDict]]:
+        """
+        Return the options and the arguments of the command from the signature
+        of the function. Parameters registered with `Hype.argument` are the
+        arguments, in the order of the signature.
+        """
+
+        #: The signature of the function
+        signature = inspect.signature(func)
+
+        #: Type hints of the function
+        type_hints = func.__annotations__
+
+        #: Set the params to none dict. It should contain the param of the function
+        #: and the type hints of the parameters
+        params = []
+        arguments = []
+        rargs_keys = self.__arguments.get(func, {})
+
+        for param in signature.parameters.values():
+            #: The annotation of the function.
+            #: For example: def func(name: str) -> str is the annotaiton
+            annotation = param.annotation
+
+            #: The param name of the function
+            #: For example: def func(name) -> name is the param.
+            param_name = param.name
+
+            #: Replace the _ to - for params
+            param_name = param_name.replace("_", "-")
+
+            if param.name in type_hints:
+                annotation = type_hints[param.name]
+
+            if param.name in rargs_keys:
+                arguments.append(rargs_keys[param.name])
+
+            else:
+                required = True if param.default is inspect.Parameter.empty else False
+                default = (
+                    param.default
+                    if param.default is not inspect.Parameter.empty
+                    else None
+                )
+                anon = annotation if annotation is not inspect.Parameter.empty else None
+
+                params.append(
+                    ParamOption(
                         convert_param_to_option(param_name),
                         required,
                         default,
                         anon,
                         param.name,
                     )
-                    self.__command_names.append(convert_param_to_option(param_name))
-                    params.append(optionparam.to_dict)
+                )
 
-            self.__commands[_name] = CommandDict(
-                _name,
-                _usage,
-                _help,
-                _aliases,
-                params,
-                func,
-            ).to_dict
-            self.__commands_function[func] = {"name": _name}
+        return params, arguments
 
-            return func
+    def __resolve(self, name: str) -> CommandDict:
+        """
+        Return the registered command. A command registered with
+        `lazy_command` is imported and reflected on the first call.
+        """
+        command = self.__commands[name]
 
-        return deco(func) if func else deco
+        if command.func is None:
+            command.func = import_string(command.target)
+
+        if command.opt is None:
+            command.opt, command.arguments = self.__reflect(command.func)
+
+        elif command.arguments is None:
+            #: The options come from a manifest
+            command.arguments = self.__reflect(command.func)[1]
+
+        return command
+
+    def dump_manifest(self, path: str, modules: Optional[List[str]] = ()):
+        """
+        Write the manifest of the registered commands. Every command
+        (including the lazy ones) is resolved first.
+
+        Parameters:
+        ---
+            path (str):
+                The path of the manifest file.
+
+            modules (List[str]):
+                Additional modules whose modification makes the manifest
+                outdated. The modules of the commands are always included.
+
+        Example:
+        ---
+            >>> app.dump_manifest('mycli.manifest')
+        """
+
+        commands = []
+        modules = list(modules)
+
+        groups = [
+            {
+                "name": group.name,
+                "usage": group.usage,
+                "help": group.help,
+                "aliases": list(group.aliases or ()),
+                "group": group.group,
+            }
+            for group in self.__groups.values()
+        ]
+
+        for name in self.__commands:
+            command = self.__resolve(name)
+            modules.append(command.func.__module__)
+
+            commands.append(
+                {
+                    "name": command.name,
+                    "usage": command.usage,
+                    "help": command.help,
+                    "aliases": list(command.aliases or ()),
+                    "target": command.target or get_target(command.func),
+                    "options": [dump_option(o.to_dict) for o in command.opt],
+                    "group": command.group,
+                }
+            )
+
+        write_manifest(path, commands, groups, get_sources(modules))
+
+    def load_manifest(self, path: str) -> bool:
+        """
+        Register the commands of a manifest written by `dump_manifest`
+        (or `python -m hype build-manifest`). The commands are registered
+        lazily with their options, so the command functions are only
+        imported when they are dispatched.
+
+        Return False if the manifest is missing or outdated.
+
+        Example:
+        ---
+            >>> app = Hype()
+            >>> if not app.load_manifest('mycli.manifest'):
+            >>>     import mycli.commands
+            >>> ...
+            >>> app.run()
+        """
+
+        manifest = read_manifest(path)
+
+        if manifest is None:
+            return False
+
+        commands, groups = manifest
+
+        for group in groups:
+            self.group(
+                group["name"],
+                group["usage"],
+                tuple(group["aliases"]),
+                group["help"],
+                group["group"],
+            )
+
+        for command in commands:
+            key = command["name"]
+
+            if command["group"]:
+                key = "%s %s" % (command["group"], key)
+
+            registered = self.__commands.get(key)
+
+            #: A lazy command of the same function is replaced by the manifest
+            if registered is None or registered.target != command["target"]:
+                self.__register_names(
+                    command["name"], command["aliases"], command["group"]
+                )
+
+            self.__commands[key] = CommandDict(
+                command["name"],
+                command["usage"],
+                command["help"],
+                tuple(command["aliases"]),
+                [ParamOption.from_dict(load_option(o)) for o in command["options"]],
+                None,
+                command["target"],
+                command["group"],
+            )
+
+        self.__invalidate()
+
+        return True
 
     def help(self, aliases: Optional[Tuple[Any]] = (), help: Optional[str] = ""):
         """
@@ -299,15 +752,10 @@ class Hype:
             help_cmd = HypeCommand("help", aliases=aliases, help=_help)
             self.__parser.add_command(help_cmd)
 
-            if (
-                len(sys.argv) < 2
-                or "-h" in sys.argv
-                or "--help" in sys.argv
-                or "help" in sys.argv
-                or aliases in sys.argv
-            ):
-                func()
-                sys.exit()
+            #: The arguments are checked when the application is run.
+            self.__help = (func, ("-h", "--help", "help") + tuple(aliases or ()))
+
+            return func
 
         return deco
 
@@ -358,19 +806,12 @@ class Hype:
             >>>     app.echo(option)
 
         """
-        name = name
-        help = help
-        type = type
-
         def deco(func):
-            self.__registered_args_func[func] = {name: {"type": type, "help": help}}
-            self.__registered_args[name] = {"type": type, "help": help}
-
-            @functools.wraps(func)
-            def wrapper(*args, **kwargs):
-                return func(*args, **kwargs)
+            self.__arguments.setdefault(func, {})[name] = ArgumentDict(
+                name, type, help
+            )
 
-            return wrapper
+            return func
 
         return deco
 
@@ -403,6 +844,209 @@ class Hype:
 
         sys.exit()
 
+    def __invalidate(self):
+        """
+        Remove the compiled commands from the parser so the dispatch
+        table is compiled again on the next `run`.
+        """
+        if self.__dispatch is None:
+            return
+
+        for name in self.__dispatch:
+            self.__parser.remove_command(name)
+
+        self.__dispatch = None
+
+    def __compile(self):
+        """
+        Compile the dispatch table. Only a lightweight `HypeCommand` is
+        created for each top level command, the option parser is built
+        lazily by `__build_options` when the command is selected and the
+        commands of a group by `__build_group` when the group is selected.
+        """
+        self.__dispatch = {}
+        self.__keys = {}
+        self.__members = {}
+
+        for registry in (self.__groups, self.__commands):
+            for key, value in registry.items():
+                self.__members.setdefault(value.group, []).append(key)
+
+        for key in self.__members.get(None, ()):
+            self.__dispatch[key] = self.__node(key)
+
+        for command in self.__dispatch.values():
+            self.__parser.add_command(command)
+
+    def __node(self, key: str) -> HypeCommand:
+        """
+        Create the HypeCommand (or HypeGroup) of the registry key.
+        """
+        if key in self.__groups:
+            group = self.__groups[key]
+            node = HypeGroup(
+                group.name,
+                group.usage,
+                group.aliases,
+                group.help,
+                builder=functools.partial(self.__build_group, key),
+                help_store=self.__help_store,
+                help_source=self.__help_source(key),
+            )
+
+        elif self.__engine == "native":
+            command = self.__commands[key]
+            node = NativeCommand(
+                command.name,
+                command.usage,
+                command.aliases,
+                command.help,
+                builder=functools.partial(self.__build_options, key),
+                options=lambda: self.__resolve(key).opt,
+                help_store=self.__help_store,
+                help_source=self.__help_source(key),
+            )
+
+        else:
+            command = self.__commands[key]
+            node = HypeCommand(
+                command.name,
+                command.usage,
+                command.aliases,
+                command.help,
+                builder=functools.partial(self.__build_options, key),
+                help_store=self.__help_store,
+                help_source=self.__help_source(key),
+            )
+
+        self.__keys[node] = key
+
+        return node
+
+    def __help_source(self, key: str) -> str:
+        """
+        Return what the help of the command (or group) is built from besides
+        its name, usage, help and aliases, see `HypeCommand.help_source`.
+        """
+        if key in self.__groups:
+            members = []
+
+            for member in self.__members.get(key, ()):
+                record = self.__groups.get(member) or self.__commands[member]
+                members.append((record.name, record.aliases, record.help))
+
+            return repr(members)
+
+        command = self.__commands[key]
+        target = command.target or "%s:%s" % (
+            command.func.__module__,
+            command.func.__qualname__,
+        )
+        options = None if command.opt is None else [o.to_dict for o in command.opt]
+
+        return repr([target, options])
+
+    def __build_group(self, key: str, group: HypeGroup):
+        """
+        Add the commands of the group. Called by `HypeGroup.parser` on first access.
+        """
+        for member in self.__members.get(key, ()):
+            group.add_command(self.__node(member))
+
+    def __completion_tree(self) -> Tuple[dict, List[str]]:
+        """
+        Return the tree of the command names, aliases and options for the
+        shell completion, and the modules it was built from. It is built
+        from the registry only, no parser is created.
+        """
+        tree = {"commands": {}, "aliases": {}}
+        nodes = {None: tree}
+
+        for key, group in self.__groups.items():
+            nodes[key] = {"commands": {}, "aliases": {}}
+
+        for key, group in self.__groups.items():
+            parent = nodes[group.group]
+            parent["commands"][group.name] = nodes[key]
+            parent["aliases"].update(dict.fromkeys(group.aliases or (), group.name))
+
+        for key, command in self.__commands.items():
+            options = []
+
+            for option in command.opt or ():
+                if option.action:
+                    options.extend(create_bool_option(option.name))
+                else:
+                    options.append(option.name)
+
+            parent = nodes[command.group]
+            parent["commands"][command.name] = {"options": options}
+            parent["aliases"].update(dict.fromkeys(command.aliases or (), command.name))
+
+        return tree, self.__modules()
+
+    def __modules(self) -> List[str]:
+        """
+        Return the main module and the modules of the imported commands.
+        """
+        modules = ["__main__"]
+
+        for command in self.__commands.values():
+            if command.func is not None:
+                modules.append(command.func.__module__)
+
+        return modules
+
+    def __build_options(self, key: str, command_parser: HypeCommand):
+        """
+        Add the arguments and options of the command to its option parser.
+        Called by `HypeCommand.parser` on first access.
+        """
+        command = self.__resolve(key)
+
+        for argument in command.arguments:
+            command_parser.parser.add_argument(
+                HypeArgument(name=argument.name, help=argument.help, type=argument.type)
+            )
+
+        for _option in command.opt:
+
+            name = _option.name
+
+            if _option.action:
+
+                #: --flag / --no-flag, the default comes from the signature.
+                for bname, action in zip(
+                    create_bool_option(_option.name), ("store_true", "store_false")
+                ):
+                    command_parser.add_option(
+                        bname,
+                        default=bool(_option.default),
+                        dest=_option.dest,
+                        action=action,
+                        metavar=_option.metavar,
+                    )
+
+            else:
+                if isinstance(name, str):
+
+                    command_parser.add_option(
+                        name,
+                        default=_option.default,
+                        type=_option.type,
+                        dest=_option.dest,
+                        metavar=_option.metavar,
+                    )
+
+                else:
+                    command_parser.add_option(
+                        *name,
+                        default=_option.default,
+                        type=_option.type,
+                        dest=_option.dest,
+                        metavar=_option.metavar
+                    )
+
     def run(self):
         """
         Run the application.
@@ -431,171 +1075,174 @@ class Hype:
 
         """
 
-        commands = []
-        boolean_options = []
-        # self.__registered_args_func = {}
-        for k in self.__commands.keys():
-
-            for ak, av in self.__registered_args_func.items():
-                for _k in av.keys():
-                    pass
-
-                if self.__commands[k]["func"].__name__ == ak.__name__:
-                    self.__command_parser = HypeCommand(
-                        self.__commands[k]["name"],
-                        self.__commands[k]["usage"],
-                        self.__commands[k]["aliases"],
-                        self.__commands[k]["help"],
-                        [
-                            HypeArgument(
-                                name=_k, help=av[_k]["help"], type=av[_k]["type"]
-                            )
-                        ],
-                    )
-                    break
+        if COMPLETE_VAR in os.environ:
+            tree, modules = self.__completion_tree()
+            complete(tree, get_sources(modules))
+            return
 
-                else:
-                    self.__command_parser = HypeCommand(
-                        self.__commands[k]["name"],
-                        self.__commands[k]["usage"],
-                        self.__commands[k]["aliases"],
-                        self.__commands[k]["help"],
-                    )
-                    break
-
-            if not self.__registered_args_func:
-                self.__command_parser = HypeCommand(
-                    self.__commands[k]["name"],
-                    self.__commands[k]["usage"],
-                    self.__commands[k]["aliases"],
-                    self.__commands[k]["help"],
-                )
+        self.__execute(sys.argv[1:])
+
+    def invoke(
+        self,
+        argv: List[str],
+        stdout: Optional[IO[str]] = None,
+        stderr: Optional[IO[str]] = None,
+    ) -> InvokeResult:
+        """
+        Run the application with the given arguments in the current process
+        and return an `InvokeResult` (the exit code, the value returned by
+        the command and the captured output) instead of exiting. The compiled
+        commands are kept between the calls, so the application can be
+        invoked repeatedly (for example by a batch job or a test suite).
 
-            if self.__commands[k]["options"]:
-                for _option in self.__commands[k]["options"]:
+        Parameters:
+        ---
+            argv (List[str]):
+                The arguments, without the program name.
 
-                    if _option["required"]:
+            stdout (IO[str]):
+                The stream of the output. It is captured by default.
 
-                        self.__required_commands.append(
-                            (
-                                self.__commands[k]["name"],
-                                convert_option_to_string(_option["name"]),
-                            )
-                        )
+            stderr (IO[str]):
+                The stream of the errors. They are captured by default.
+
+        Example:
+        ---
+            >>> result = app.invoke(['greet', '--name', 'Zenqi'])
+            >>> result.exit_code
+            0
+            >>> result.stdout
+            'Hello, Zenqi\n'
+        """
 
-                    name = _option["name"]
-
-                    if _option["action"]:
-
-                        bool_name = create_bool_option(_option["name"])
-                        for bname in bool_name:
-                            
-                            if bname == _option["name"]:
-                                if _option['name'].startswith('--no'):
-                                    action = 'store_false'
-                                else:
-                                    action = 'store_true'
-                                
-                                _default = True if action == 'store_true' else False
-                                self.__command_parser.parser.add_option(
-                                    _option["name"],
-                                    default=_default,
-                                    dest=_option["dest"],
-                                    action=action,
-                                    metavar=_option["metavar"],
-                                )
-                            else:
-                                if bname.startswith('--no'):
-                                    default = False
-                                else:
-                                    default = True
-                                
-                                self.__command_parser.parser.add_option(
-                                    bname,
-                                    default=default,
-                                    dest=_option["dest"],
-                                    action="store_false",
-                                    metavar=_option["metavar"],
-                                )
-
-                    else:
-                        if isinstance(name, str):
-
-                            self.__command_parser.parser.add_option(
-                                name,
-                                default=_option["default"],
-                                type=_option["type"],
-                                dest=_option["dest"],
-                                metavar=_option["metavar"],
-                            )
-
-                        else:
-                            self.__command_parser.parser.add_option(
-                                *name,
-                                default=_option["default"],
-                                type=_option["type"],
-                                dest=_option["dest"],
-                                metavar=_option["metavar"]
-                            )
-
-            commands.append(self.__command_parser)
-
-        for i in commands:
-            self.__parser.add_command(i)
+        out = stdout or io.StringIO()
+        err = stderr or io.StringIO()
+        exit_code, result = 0, None
+
+        try:
+            with contextlib.redirect_stdout(out):
+                with contextlib.redirect_stderr(err):
+                    result = self.__execute(list(argv))
+
+        except SystemExit as exc:
+            if exc.code is None:
+                exit_code = 0
+
+            elif isinstance(exc.code, int):
+                exit_code = exc.code
+
+            else:
+                err.write("%s\n" % (exc.code))
+                exit_code = 1
+
+        return InvokeResult(
+            exit_code,
+            result,
+            None if stdout else out.getvalue(),
+            None if stderr else err.getvalue(),
+        )
+
+    def __execute(self, args: List[str]) -> Any:
+        """
+        Parse the arguments and call the command. Return the value
+        returned by the command.
+        """
+
+        if self.__help:
+            func, names = self.__help
+
+            if not args or any(name in args for name in names):
+                func()
+                sys.exit()
+
+        if self.__dispatch is None:
+            self.__compile()
 
         (
             option,
             command,
             command_opt,
             command_args,
-        ) = self.__parser.parse_args()
+        ) = self.__parser.parse_args(args)
 
         params = []
 
-        for i in boolean_options:
-            self.__command_parser.parser.add_option(
-                i["name"], default=i["default"], type=i["type"], action=i["action"]
-            )
+        key = self.__keys.get(command)
+
+        if key in self.__commands:
+            command = self.__commands[key]
+            func = command.func
 
-        if command.name in self.__commands:
-            func = self.__commands[command.name]["func"]
+            if command_args and not command.arguments:
+                self.__parser.error('No argument registered: %s' % (command_args))
+                self.__parser.exit()
 
-            if command_args:
-                # TODO: Check for function registered and return the args
-                # NOTE: Please if you have some time improving this, create a pull req
+            for index, argument in enumerate(command.arguments):
+                value = command_args[index] if index < len(command_args) else None
 
-                if not self.__registered_args:
-                    self.__parser.error('No argument registered: %s' % (command_args))
-                    self.__parser.exit()
-                
-                for k, v in self.__registered_args_func.items():
-                    
-                    if k.__name__ == func.__name__:
-                        for t in range(len(v)):
-                            for _k in v.keys():
-                                if v[_k]["type"]:
-                                    v[_k]["type"](command_args[t])
+                if argument.type and value is not None:
+                    #: Validate the argument, the value is passed as it is.
+                    argument.type(value)
 
-                            params.append(command_args[t])
+                params.append(value)
+
+            if isinstance(command_opt, list):
+                #: The native engine returns the option values in order
+                #: and already checked the required options.
+                params.extend(command_opt)
 
             else:
-                args_value = {}
-                has_args = False
-                for k,v in self.__registered_args_func.items():
-                    args_value = v
-                    if k.__name__ == func.__name__:
-                        has_args = True
-                
-                if has_args:
-                    params.append(None)
-                else:
-                    pass
-            
-            for _k, v in vars(command_opt).items():
-                if (command.name, _k) in self.__required_commands and v == None:
-                    self.__parser.error("Option: {} is required.".format(_k))
-                    self.__parser.exit()
+                required = [o.dest for o in command.opt if o.required]
 
-                params.append(v)
+                for _k, v in vars(command_opt).items():
+                    if _k in required and v == None:
+                        self.__parser.error("Option: {} is required.".format(_k))
+                        self.__parser.exit()
+
+                    params.append(v)
             
-            func(*params)
+            return func(*params)
+
+
+class CommandGroup:
+    """
+    A group of commands returned by `Hype.group`. The commands and
+    groups registered through it are registered on the application
+    under the path of the group.
+
+    Example:
+
+        >>> db = app.group('db')
+        >>> @db.command()
+        >>> def migrate():
+        >>>     ...
+
+    """
+
+    def __init__(self, app: Hype, path: str):
+        self.app = app
+        self.path = path
+
+    def command(self, *args, **kwargs):
+        """
+        A command decorator for the group. See `Hype.command`
+        """
+        return self.app.command(*args, group=self.path, **kwargs)
+
+    def lazy_command(self, *args, **kwargs):
+        """
+        Register a lazy command on the group. See `Hype.lazy_command`
+        """
+        return self.app.lazy_command(*args, group=self.path, **kwargs)
+
+    def group(self, *args, **kwargs) -> "CommandGroup":
+        """
+        Register a sub group. See `Hype.group`
+        """
+        return self.app.group(*args, group=self.path, **kwargs)
+
+    def argument(self, *args, **kwargs):
+        """
+        An argument decorator. See `Hype.argument`
+        """
+        return self.app.argument(*args, **kwargs)
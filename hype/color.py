@@ -20,33 +20,52 @@
 
 #: The parser was inspired at pyskcode. Thanks to https://github.com/TamiaLab/PySkCode
 
+import functools
+import html
+import importlib.util
+import re
 import string
 from .constants import rule_colors
-from .constants import rule_styles
 from .constants import bg_colors
 from .constants import all_tags
+from .style import AnsiBack
+from .style import AnsiFore
+from .style import AnsiStyle
+from .style import CSI
+from typing import Any
+from typing import List
 from typing import Optional
 from typing import IO
+from typing import Tuple
+from .errors import ColorNotFound
 from .errors import PluginError
 from .errors import TagNotFound
+from .terminal import EXTENDED_COLOR
+from .terminal import TRUE_COLOR
+from .terminal import get_terminal
 
-__all__ = ["print_color", "parsed_color"]
+__all__ = [
+    "print_color",
+    "parse_color",
+    "compile_markup",
+    "cache_info",
+    "render",
+    "get_render_target",
+    "ColorStream",
+]
 
-try:
-
-    import colorama
-
-    colorama.init()
-    COLOR_SUPPORTED = True
-
-except ModuleNotFoundError:
-    COLOR_SUPPORTED = False
+#: colorama is not imported here, the terminal does it only if it is needed.
+COLORAMA_AVAILABLE = importlib.util.find_spec("colorama") is not None
 
 
 # Character charsets
 WHITESPACE_CHARSET = frozenset(string.whitespace)
 IDENTIFIER_CHARSET = frozenset(string.ascii_letters + string.digits + "_*")
 
+# The charsets as regular expression classes
+WHITESPACE_PATTERN = "[%s]" % (re.escape(string.whitespace))
+IDENTIFIER_PATTERN = "[%s]" % (re.escape(string.ascii_letters + string.digits + "_*"))
+
 # Token types
 TOKEN_DATA = 0
 TOKEN_NEWLINE = 1
@@ -54,6 +73,213 @@ TOKEN_OPEN_TAG = 2
 TOKEN_CLOSE_TAG = 3
 TOKEN_SELF_CLOSE_TAG = 4
 
+#: The style state of the text is a tuple of the SGR codes of the
+#: foreground, the background, bold, italic and underline.
+DEFAULT_STATE = (
+    AnsiFore.RESET,
+    AnsiBack.RESET,
+    AnsiStyle.NORMAL,
+    AnsiStyle.NOT_ITALIC,
+    AnsiStyle.NOT_UNDERLINE,
+)
+
+#: The index of the state and the SGR code set by each tag.
+STATE_CODES = {
+    "fg": {name: (0, getattr(AnsiFore, name.upper())) for name in rule_colors},
+    "bg": {name: (1, getattr(AnsiBack, name.upper())) for name in bg_colors},
+    "style": {
+        "bold": (2, AnsiStyle.BOLD),
+        "b": (2, AnsiStyle.BOLD),
+        "italic": (3, AnsiStyle.ITALIC),
+        "i": (3, AnsiStyle.ITALIC),
+        "underline": (4, AnsiStyle.UNDERLINE),
+        "u": (4, AnsiStyle.UNDERLINE),
+    },
+}
+
+#: The rgb of the 16 basic colors (the xterm palette), their SGR code is
+#: 30 + index (40 + index for the background), 90 + index - 8 for the bright ones.
+BASIC_PALETTE = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+
+#: The levels of the 6x6x6 color cube of the 256 colors.
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+#: The hex, rgb and 256 color values
+HEX_COLOR_PATTERN = re.compile(r"#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$")
+RGB_COLOR_PATTERN = re.compile(r"rgb\((\d{1,3}),(\d{1,3}),(\d{1,3})\)$")
+
+#: The css of the tags rendered by the `html` target.
+HTML_STYLES = {
+    "fg": {
+        name: "color:%s" % ("initial" if name == "reset" else name)
+        for name in rule_colors
+    },
+    "bg": {
+        name: "background-color:%s" % ("initial" if name == "reset" else name)
+        for name in bg_colors
+    },
+    "style": {
+        "bold": "font-weight:bold",
+        "b": "font-weight:bold",
+        "italic": "font-style:italic",
+        "i": "font-style:italic",
+        "underline": "text-decoration:underline",
+        "u": "text-decoration:underline",
+    },
+}
+
+def get_index_rgb(index: int) -> Tuple[int, int, int]:
+    """
+    Return the rgb of a color of the 256 colors.
+    """
+    if index < 16:
+        return BASIC_PALETTE[index]
+
+    if index < 232:
+        index -= 16
+        return (
+            CUBE_LEVELS[index // 36],
+            CUBE_LEVELS[index // 6 % 6],
+            CUBE_LEVELS[index % 6],
+        )
+
+    level = 8 + (index - 232) * 10
+    return (level, level, level)
+
+
+def get_distance(rgb: Tuple[int, int, int], other: Tuple[int, int, int]) -> int:
+    return sum((a - b) ** 2 for a, b in zip(rgb, other))
+
+
+def get_256_index(rgb: Tuple[int, int, int]) -> int:
+    """
+    Return the nearest color of the 256 colors, from the color cube
+    or the gray scale.
+    """
+    cube = [0 if v < 48 else 1 if v < 115 else (v - 35) // 40 for v in rgb]
+    cube_index = 16 + 36 * cube[0] + 6 * cube[1] + cube[2]
+
+    gray = min(23, max(0, (sum(rgb) // 3 - 3) // 10))
+    gray_index = 232 + gray
+
+    if get_distance(rgb, get_index_rgb(gray_index)) < get_distance(
+        rgb, get_index_rgb(cube_index)
+    ):
+        return gray_index
+
+    return cube_index
+
+
+def get_basic_index(rgb: Tuple[int, int, int]) -> int:
+    """
+    Return the nearest color of the 16 basic colors.
+    """
+    return min(range(16), key=lambda index: get_distance(rgb, BASIC_PALETTE[index]))
+
+
+def parse_color_value(value: str) -> Tuple[str, object]:
+    """
+    Parse the value of a color attribute. Return `("name", name)` for
+    the basic colors, `("index", index)` for the 256 colors and
+    `("rgb", (r, g, b))` for `#rrggbb`, `#rgb` and `rgb(r,g,b)`.
+    Raise `ColorNotFound` on an invalid color.
+    """
+    if value in rule_colors:
+        return "name", value
+
+    match = HEX_COLOR_PATTERN.match(value)
+
+    if match:
+        digits = match.group(1)
+
+        if len(digits) == 3:
+            digits = "".join(digit * 2 for digit in digits)
+
+        return "rgb", tuple(int(digits[i : i + 2], 16) for i in (0, 2, 4))
+
+    match = RGB_COLOR_PATTERN.match(value.replace(" ", ""))
+
+    if match and all(int(v) < 256 for v in match.groups()):
+        return "rgb", tuple(int(v) for v in match.groups())
+
+    if value.isdigit() and int(value) < 256:
+        return "index", int(value)
+
+    raise ColorNotFound("%s is not a supported color." % (value))
+
+
+@functools.lru_cache(maxsize=1024)
+def get_color_code(value: str, background: bool, depth: int) -> object:
+    """
+    Return the SGR code of a color value (see `parse_color_value`), downsampled
+    to the color depth of the terminal: truecolor -> 256 colors -> 16 colors.
+    The codes are kept in a bounded table.
+    """
+    kind, color = parse_color_value(value)
+
+    if kind == "name":
+        return getattr(AnsiBack if background else AnsiFore, color.upper())
+
+    if kind == "rgb" and depth >= TRUE_COLOR:
+        return "%d;2;%d;%d;%d" % (((48 if background else 38),) + color)
+
+    if kind == "rgb" and depth >= EXTENDED_COLOR:
+        kind, color = "index", get_256_index(color)
+
+    if kind == "index" and depth >= EXTENDED_COLOR:
+        return "%d;5;%d" % (48 if background else 38, color)
+
+    if kind == "index":
+        color = get_index_rgb(color)
+
+    index = get_basic_index(color)
+
+    if index < 8:
+        return (40 if background else 30) + index
+
+    return (100 if background else 90) + index - 8
+
+
+def get_color_css(value: str) -> str:
+    """
+    Return the css color of a color value (see `parse_color_value`).
+    """
+    kind, color = parse_color_value(value)
+
+    if kind == "name":
+        return "initial" if color == "reset" else color
+
+    if kind == "index":
+        color = get_index_rgb(color)
+
+    return "#%02x%02x%02x" % color
+
+
+#: The render targets
+TARGETS = ("ansi", "plain", "html")
+
+#: The number of texts kept by the cache of `parse_color`, and the length
+#: of the longest text that is cached.
+CACHE_SIZE = 1024
+CACHE_MAX_LENGTH = 4096
+
 
 def skip_whitespaces(text: str, offset: int):
     """
@@ -331,23 +557,22 @@ def tokenize_newline(data: str):
         yield TOKEN_DATA, None, None, last_line
 
 
-def tokenize_tag(
-    text: str,
+def compile_tag_pattern(
     opening_tag_ch="[",
     closing_tag_ch="]",
     allow_tagvalue_attr=True,
     allow_self_closing_tags=True,
 ):
     """
-    Split the given text into tokens (generator function).
-    :param text: The input text to be tokenize.
+    Compile the regular expression of a tag, with the same syntax as ``parse_tag``.
+    The match groups are the closing tag name, the tag name, the tag attributes
+    (the tag value included) and the self closing slash.
     :param opening_tag_ch: The opening tag char (must be one char long, default '[').
     :param closing_tag_ch: The closing tag char (must be one char long, default ']').
     :param allow_tagvalue_attr: Set to ``True`` to allow the BBcode ``tagname=tagvalue`` syntax shortcut
     (default is ``True``).
     :param allow_self_closing_tags: Set to ``True`` to allow the self closing tags syntax (default is ``True``).
     """
-    assert text, "No text input given (mandatory)."
     assert (
         len(opening_tag_ch) == 1
     ), "Opening tag character must be one char long exactly."
@@ -355,72 +580,171 @@ def tokenize_tag(
         len(closing_tag_ch) == 1
     ), "Closing tag character must be one char long exactly."
 
+    ws = WHITESPACE_PATTERN
+    opening = re.escape(opening_tag_ch)
+    closing = re.escape(closing_tag_ch)
+
+    # The identifiers are greedy, a shorter match would split them in two.
+    name = "%s+(?!%s)" % (IDENTIFIER_PATTERN, IDENTIFIER_PATTERN)
+    value = (
+        r"""(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|(?!["'])[^%s%s%s]*)(?=%s|%s)"""
+        % (opening, closing, ws[1:-1], closing, ws)
+    )
+    attribute = "%s%s*(?:=%s*%s%s*)?" % (name, ws, ws, value, ws)
+    tagvalue = "(?:=%s*%s%s*)?" % (ws, value, ws) if allow_tagvalue_attr else ""
+    self_closing = "(/)?%s*" % (ws) if allow_self_closing_tags else "()"
+
+    return re.compile(
+        "%(o)s%(ws)s*(?:/%(ws)s*(%(name)s)%(ws)s*%(c)s|"
+        "(%(name)s)(%(ws)s*%(tagvalue)s(?:%(attribute)s)*)%(self_closing)s%(c)s)"
+        % {
+            "o": opening,
+            "c": closing,
+            "ws": ws,
+            "name": name,
+            "tagvalue": tagvalue,
+            "attribute": attribute,
+            "self_closing": self_closing,
+        },
+        re.DOTALL,
+    )
+
+
+#: The compiled tag patterns by their parameters
+get_tag_pattern = functools.lru_cache()(compile_tag_pattern)
+
+#: The pattern of the attributes of a tag matched by `compile_tag_pattern`
+ATTRIBUTE_PATTERN = re.compile(
+    r"""(%s+)%s*(?:=%s*("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|[^%s]*))?"""
+    % (IDENTIFIER_PATTERN, WHITESPACE_PATTERN, WHITESPACE_PATTERN, WHITESPACE_PATTERN[1:-1]),
+    re.DOTALL,
+)
+
+#: Escaped chars in the quoted attribute values
+ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+
+
+def get_tag_attributes(source: str):
+    """
+    Return the attributes (as a dictionary) of the tag name and the tag attributes
+    matched by `compile_tag_pattern`. Like ``parse_tag``, the tag value is stored by the tag name.
+    :param source: The tag name followed by the tag attributes.
+    """
+    tag_attrs = {}
+
+    for index, match in enumerate(ATTRIBUTE_PATTERN.finditer(source)):
+        attr_name, attr_value = match.groups()
+
+        if attr_value is None:
+            if index == 0:
+                # The tag name, without a tag value
+                continue
+
+            attr_value = ""
+
+        elif attr_value[:1] in ("'", '"'):
+            quoting_ch = attr_value[0]
+
+            # Only the quoting char and the backslash char can be escaped
+            attr_value = ESCAPE_PATTERN.sub(
+                lambda m: m.group(1) if m.group(1) in (quoting_ch, "\\") else m.group(0),
+                attr_value[1:-1],
+            )
+
+        tag_attrs[attr_name.lower()] = attr_value.strip()
+
+    return tag_attrs
+
+
+def tokenize_tag(
+    text: str,
+    opening_tag_ch="[",
+    closing_tag_ch="]",
+    allow_tagvalue_attr=True,
+    allow_self_closing_tags=True,
+):
+    """
+    Split the given text into tokens (generator function).
+    The tags are matched with a compiled regular expression (see ``compile_tag_pattern``)
+    so the text is processed in linear time, without exceptions on invalid tags.
+    :param text: The input text to be tokenize.
+    :param opening_tag_ch: The opening tag char (must be one char long, default '[').
+    :param closing_tag_ch: The closing tag char (must be one char long, default ']').
+    :param allow_tagvalue_attr: Set to ``True`` to allow the BBcode ``tagname=tagvalue`` syntax shortcut
+    (default is ``True``).
+    :param allow_self_closing_tags: Set to ``True`` to allow the self closing tags syntax (default is ``True``).
+    """
+    match_tag = get_tag_pattern(
+        opening_tag_ch, closing_tag_ch, allow_tagvalue_attr, allow_self_closing_tags
+    ).match
+
     # Normalize newlines (fastest method)
     text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     # Search an opening tag
-    start = text.find(opening_tag_ch)
+    find = text.find
+    start = find(opening_tag_ch)
     pos = 0
 
     # Process the whole text until no more tag can be found
     # N.B. string.find(s, beg) return -1 if beg >= len(string)
     while start >= 0:
 
-        # Run the parser to get the tag
-        try:
-            tag = parse_tag(
-                text,
-                start,
-                opening_tag_ch,
-                closing_tag_ch,
-                allow_tagvalue_attr,
-                allow_self_closing_tags,
-            )
-
-        except (IndexError, ValueError):
+        match = match_tag(text, start)
 
-            # Continue searching if not a valid tag
-            start = text.find(opening_tag_ch, start + 1)
+        # Continue searching if not a valid tag
+        if match is None:
+            start = find(opening_tag_ch, start + 1)
             continue
 
         # Get the text before the tag, if any
         if start > pos:
-            text_before_tag = text[pos:start]
-            yield from tokenize_newline(text_before_tag)
+            data = text[pos:start]
 
-        # Unpack the tag structure
-        tag_name, is_closing_tag, is_self_closing_tag, tag_attrs, offset = tag
-        tag_source = text[start:offset]
+            if "\n" in data:
+                yield from tokenize_newline(data)
+            else:
+                yield TOKEN_DATA, None, None, data
+
+        closing_name, tag_name, tag_attrs, is_self_closing_tag = match.groups()
+        offset = match.end()
 
         # Yield the tag token
-        if is_self_closing_tag:
-            yield TOKEN_SELF_CLOSE_TAG, tag_name, tag_attrs, tag_source
-        elif is_closing_tag:
-            yield TOKEN_CLOSE_TAG, tag_name, tag_attrs, tag_source
+        if closing_name is not None:
+            yield TOKEN_CLOSE_TAG, closing_name.lower(), {}, text[start:offset]
+
         else:
-            yield TOKEN_OPEN_TAG, tag_name, tag_attrs, tag_source
+            # Most tags have no attribute
+            tag_attrs = get_tag_attributes(tag_name + tag_attrs) if tag_attrs else {}
+            token_type = TOKEN_SELF_CLOSE_TAG if is_self_closing_tag else TOKEN_OPEN_TAG
+
+            yield token_type, tag_name.lower(), tag_attrs, text[start:offset]
 
         # Store the current position in text for next loop
         pos = offset
 
         # Search the next tag if any
-        start = text.find(opening_tag_ch, offset)
+        start = find(opening_tag_ch, offset)
 
     # Yield the remaining piece of text if any
-    remaining_text = text[pos:]
-    if remaining_text:
-        yield from tokenize_newline(remaining_text)
+    if pos < len(text):
+        yield from tokenize_newline(text[pos:])
 
 
-def parse_color(text: str = ""):
+def parse_color(text: str = "", depth: Optional[int] = None):
     """
-    Parsed the text of string that contains color tag into colored texts
+    Parsed the text of string that contains color tag into colored texts.
+    The recurring texts are served from a bounded LRU cache, see `cache_info`.
 
     Parameters:
     ---
         text(str):
             The string to be parsed.
 
+        depth(int):
+            The color depth the hex, rgb and 256 colors are downsampled to.
+            By default it is the depth of the terminal, see `get_color_depth`.
+
     Example:
     ---
 
@@ -433,45 +757,446 @@ def parse_color(text: str = ""):
 
     """
 
+    depth = depth or get_color_depth()
+
+    if len(text) > CACHE_MAX_LENGTH:
+        return render_color(text, depth)
+
+    return _cached_render_color(text, depth)
+
+
+def render_color(text: str = "", depth: Optional[int] = None):
+    """
+    Render the color tags of the text, without the cache of `parse_color`.
+    """
+
+    return "".join(render_tokens(tokenize_tag(text), [], depth or get_color_depth()))
+
+
+def get_color_depth(file: Optional[IO[str]] = None) -> int:
+    """
+    Return the color depth of the terminal of the file (`sys.stdout` by
+    default). The colors are not downsampled when it is not a terminal.
+    """
+    return get_terminal(file).color_depth or TRUE_COLOR
+
+
+def get_sgr_diff(state: Tuple[int, ...], new_state: Tuple[int, ...]) -> str:
+    """
+    Return the SGR escape sequence changing the style state to the new one,
+    with only the codes that differ.
+    """
+    try:
+        return _sgr_diffs[state, new_state]
+
+    except KeyError:
+        codes = [str(code) for old, code in zip(state, new_state) if old != code]
+        sequence = CSI + ";".join(codes) + "m" if codes else ""
+
+        if len(_sgr_diffs) < 4096:
+            _sgr_diffs[state, new_state] = sequence
+
+        return sequence
+
+
+_sgr_diffs = {}
+
+
+def get_tag_state(
+    tag_name: str, tag_attr: dict, state: Tuple[int, ...], depth: int = TRUE_COLOR
+) -> Tuple[int, ...]:
+    """
+    Return the style state inside the tag opened in the given state. The
+    hex, rgb and 256 colors are downsampled to the color depth.
+    """
+    if tag_name not in all_tags:
+        raise TagNotFound(
+            '\n\n"%s" is not found. check avaialble tags on the documentation:\nhttps://hype.serum.studio\n\n'
+            % (tag_name)
+        )
+
+    if tag_name == "bg":
+
+        if "color" in tag_attr:
+            color = tag_attr.get("color")
+
+            if color in bg_colors:
+                index, code = STATE_CODES["bg"][color]
+            else:
+                index, code = 1, get_color_code(color, True, depth)
+
+        else:
+            raise AttributeError(
+                "when defining background, color attribute must define."
+            )
+
+    elif tag_name == "color":
+
+        if tag_attr.get("color"):
+            index, code = 0, get_color_code(tag_attr["color"], False, depth)
+
+        else:
+            raise AttributeError("the color tag must define a color: [color=#ff8800]")
+
+    elif tag_name in rule_colors:
+        index, code = STATE_CODES["fg"][tag_name]
+
+    else:
+        index, code = STATE_CODES["style"][tag_name]
+
+    return state[:index] + (code,) + state[index + 1 :]
+
+
+def render_tokens(
+    tokens, stack: List[Tuple[str, Tuple[int, ...]]], depth: int = TRUE_COLOR
+) -> List[str]:
+    """
+    Render the tokens of `tokenize_tag`. Return the list of the rendered pieces.
+    Each tag changes only what it styles, and a closing tag restores the style
+    of its parent (bold text stays bold after a nested color is closed).
+
+    Parameters:
+    ---
+        tokens (Iterable):
+            The tokens to be rendered.
+
+        stack (List[Tuple]):
+            The open tags, as `(tag name, style state)`. It is updated with the
+            rendered tags so the rendering can continue with the next tokens.
+
+        depth (int):
+            The color depth of the terminal, see `hype.terminal`.
+
+    """
+
     parsed_text = []
-    tokens = tokenize_tag(text)
+    state = stack[-1][1] if stack else DEFAULT_STATE
 
     for token in tokens:
         token_type, tag_name, tag_attr, token_source = token
 
-        if token_type == TOKEN_OPEN_TAG:
-            if tag_name not in all_tags:
-                raise TagNotFound(
-                    '\n\n"%s" is not found. check avaialble tags on the documentation:\nhttps://hype.serum.studio\n\n'
-                    % (tag_name)
-                )
+        if token_type == TOKEN_DATA or token_type == TOKEN_NEWLINE:
+            parsed_text.append(token_source)
+
+        elif token_type == TOKEN_OPEN_TAG:
+            new_state = get_tag_state(tag_name, tag_attr, state, depth)
+            stack.append((tag_name, new_state))
+
+            if new_state != state:
+                parsed_text.append(get_sgr_diff(state, new_state))
+                state = new_state
+
+        elif token_type == TOKEN_CLOSE_TAG:
+            #: Close the tag, and the tags left open inside of it.
+            for index in range(len(stack) - 1, -1, -1):
+                if stack[index][0] == tag_name:
+                    del stack[index:]
+                    break
+
+            else:
+                continue
+
+            new_state = stack[-1][1] if stack else DEFAULT_STATE
+
+            if new_state != state:
+                parsed_text.append(get_sgr_diff(state, new_state))
+                state = new_state
+
+    return parsed_text
 
-            if tag_name in rule_colors:
-                parsed_text.append(rule_colors[tag_name])
 
-            if tag_name in rule_styles:
-                parsed_text.append(rule_styles[tag_name])
+def render_plain_tokens(tokens, stack: list) -> List[str]:
+    """
+    Render the tokens of `tokenize_tag` without the tags. Like `render_tokens`
+    but no style is kept, the stack is not used.
+    """
+    return [
+        token[3]
+        for token in tokens
+        if token[0] == TOKEN_DATA
+        or token[0] == TOKEN_NEWLINE
+        or token[1] not in all_tags
+    ]
+
+
+def render_plain(text: str = "") -> str:
+    """
+    Remove the color tags of the text in one pass. Unlike `parse_color`,
+    the unknown tags are kept as they are.
+
+    Example:
+    ---
+
+        >>> render_plain('[red]error[/red] in items[0]')
+        'error in items[0]'
+    """
+
+    def replace(match):
+        return "" if (match.group(1) or match.group(2)).lower() in all_tags else match.group()
+
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    return get_tag_pattern().sub(replace, text)
+
+
+def render_html_tokens(tokens, stack: List[Tuple[str, str]]) -> List[str]:
+    """
+    Render the tokens of `tokenize_tag` as html. Each tag is a `<span>` styled
+    with `HTML_STYLES` and the text is escaped.
+
+    Parameters:
+    ---
+        tokens (Iterable):
+            The tokens to be rendered.
+
+        stack (List[Tuple]):
+            The open tags, as `(tag name, css)`.
+
+    """
+
+    parsed_text = []
+
+    for token in tokens:
+        token_type, tag_name, tag_attr, token_source = token
+
+        if token_type == TOKEN_DATA or token_type == TOKEN_NEWLINE:
+            parsed_text.append(html.escape(token_source, quote=False))
+
+        elif token_type == TOKEN_OPEN_TAG:
+            #: The tag is checked like the ansi target.
+            get_tag_state(tag_name, tag_attr, DEFAULT_STATE)
 
             if tag_name == "bg":
+                css = "background-color:%s" % (get_color_css(tag_attr["color"]))
+            elif tag_name == "color":
+                css = "color:%s" % (get_color_css(tag_attr["color"]))
+            elif tag_name in rule_colors:
+                css = HTML_STYLES["fg"][tag_name]
+            else:
+                css = HTML_STYLES["style"][tag_name]
 
-                if "color" in tag_attr:
-                    parsed_text.append(bg_colors[tag_attr.get("color")])
+            stack.append((tag_name, css))
+            parsed_text.append('<span style="%s">' % (css))
 
-                else:
-                    raise AttributeError(
-                        "when defining background, color attribute must define."
-                    )
+        elif token_type == TOKEN_CLOSE_TAG:
+            for index in range(len(stack) - 1, -1, -1):
+                if stack[index][0] == tag_name:
+                    parsed_text.append("</span>" * (len(stack) - index))
+                    del stack[index:]
+                    break
 
-        if token_type == TOKEN_CLOSE_TAG:
-            parsed_text.append(rule_colors["reset"])
+    return parsed_text
 
-        if token_type == TOKEN_DATA:
-            parsed_text.append(token_source)
 
-        if token_type == TOKEN_NEWLINE:
-            parsed_text.append(token_source)
+def render_html(text: str = "") -> str:
+    """
+    Render the color tags of the text as html `<span>` elements.
+
+    Example:
+    ---
+
+        >>> render_html('[b]1 < 2[/b]')
+        '<span style="font-weight:bold">1 &lt; 2</span>'
+    """
+    stack = []
+    parsed_text = render_html_tokens(tokenize_tag(text), stack)
+
+    return "".join(parsed_text) + "</span>" * len(stack)
 
-    return "".join(parsed_text)
+
+#: The token renderers of the targets
+TOKEN_RENDERERS = {
+    "ansi": render_tokens,
+    "plain": render_plain_tokens,
+    "html": render_html_tokens,
+}
+
+
+def get_render_target(file: Optional[IO[str]] = None) -> str:
+    """
+    Return the render target of the output written to the file (by default
+    `sys.stdout`): `plain` if the `NO_COLOR` environment variable is set or the
+    file is not a terminal (a pipe or a file), `ansi` otherwise. See `hype.terminal`.
+    """
+    return "ansi" if get_terminal(file).color_depth else "plain"
+
+
+def render(text: str = "", target: Optional[str] = None, file: Optional[IO[str]] = None) -> str:
+    """
+    Render the color tags of the text for a target.
+
+    Parameters:
+    ---
+        text (str):
+            The string to be rendered.
+
+        target (str):
+            `ansi` (the escape codes, like `parse_color`), `plain` (the tags
+            are removed) or `html`. By default it is `get_render_target(file)`
+
+        file (IO[str]):
+            The file the text will be written to, see `get_render_target`.
+
+    """
+    target = target or get_render_target(file)
+
+    if target == "ansi":
+        return parse_color(text, get_color_depth(file))
+
+    if target == "plain":
+        return render_plain(text)
+
+    if target == "html":
+        return render_html(text)
+
+    raise ValueError("{} is not a supported render target".format(target))
+
+
+class ColorStream:
+    """
+    A writable stream that renders the color tags of the text written to it
+    chunk by chunk. A tag split between two chunks is kept until the next
+    chunk, and the open tags are kept between the chunks, so the text can be
+    written in pieces of any size and the output is written right away.
+
+    Parameters:
+    ---
+        write_target (IO[str] or Callable):
+            The file-like object (or the function) the rendered text is written to.
+
+        target (str):
+            The render target (see `render`). By default it is
+            `get_render_target(write_target)`
+
+    Example:
+    ---
+
+        >>> import sys
+        >>> with ColorStream(sys.stdout) as stream:
+        >>>     for line in report:
+        >>>         stream.write(line)
+
+    """
+
+    #: The length of the longest tag that can be split between two chunks.
+    MAX_TAG_LENGTH = 256
+
+    #: The size of the chunks read by `copy_from`
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, write_target, target: Optional[str] = None):
+        self.write_target = write_target
+        self.target = target or get_render_target(
+            write_target if hasattr(write_target, "write") else None
+        )
+        self.stack = []
+        self.closed = False
+
+        if self.target not in TOKEN_RENDERERS:
+            raise ValueError("{} is not a supported render target".format(self.target))
+
+        if self.target == "ansi" and hasattr(write_target, "write"):
+            get_terminal(write_target).enable_ansi()
+
+        self.__render = TOKEN_RENDERERS[self.target]
+
+        if self.target == "ansi":
+            self.__render = functools.partial(
+                render_tokens,
+                depth=get_color_depth(write_target if hasattr(write_target, "write") else None),
+            )
+        self.__write = getattr(write_target, "write", write_target)
+        self.__pending = ""
+        self.__match_tag = get_tag_pattern().match
+
+    def __split(self, text: str) -> int:
+        """
+        Return the offset of the text that can be rendered now. The rest
+        may be the start of a tag (or of a \\r\\n newline) completed by the
+        next chunk.
+        """
+        end = len(text)
+
+        if text.endswith("\r"):
+            end -= 1
+
+        start = text.find("[", max(0, end - self.MAX_TAG_LENGTH), end)
+
+        while start >= 0:
+            match = self.__match_tag(text, start)
+
+            if match is None:
+                return start
+
+            start = text.find("[", match.end(), end)
+
+        return end
+
+    def write(self, chunk: str) -> int:
+        """
+        Render and write the chunk. Return the length of the chunk.
+        """
+        if self.closed:
+            raise ValueError("write to closed ColorStream")
+
+        text = self.__pending + chunk
+        offset = self.__split(text)
+        self.__pending = text[offset:]
+
+        if offset:
+            self.__write("".join(self.__render(tokenize_tag(text[:offset]), self.stack)))
+
+        return len(chunk)
+
+    def copy_from(self, source: IO[str], chunk_size: Optional[int] = None):
+        """
+        Render and write the whole content of a file-like object.
+        """
+        read = source.read
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        chunk = read(chunk_size)
+
+        while chunk:
+            self.write(chunk)
+            chunk = read(chunk_size)
+
+    def flush(self):
+        """
+        Flush the write target. The text kept for the next chunk is not written.
+        """
+        flush = getattr(self.write_target, "flush", None)
+
+        if flush:
+            flush()
+
+    def close(self):
+        """
+        Write the text kept for the next chunk and reset the styles of the tags
+        that are still open. The write target is not closed.
+        """
+        if self.closed:
+            return
+
+        if self.__pending:
+            self.__write("".join(self.__render(tokenize_tag(self.__pending), self.stack)))
+            self.__pending = ""
+
+        if self.stack and self.target == "ansi":
+            self.__write(get_sgr_diff(self.stack[-1][1], DEFAULT_STATE))
+
+        elif self.stack and self.target == "html":
+            self.__write("</span>" * len(self.stack))
+
+        self.stack = []
+
+        self.closed = True
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
 
 def print_color(
@@ -480,15 +1205,20 @@ def print_color(
     end: Optional[str] = "\n",
     file: Optional[IO[str]] = None,
     flush: Optional[bool] = False,
+    target: Optional[str] = None,
 ):
 
     """
     Simillar to built-in function, `print` but it prints a colored text
-    from `parsed_color`
+    from `parsed_color`. The text is printed without the tags when the
+    file is not a terminal or `NO_COLOR` is set (see `get_render_target`).
 
     Parameters:
     ---
-        Similar to `print`
+        Similar to `print` and:
+
+        target (str):
+            The render target, see `render`.
 
     Example:
     ---
@@ -498,7 +1228,9 @@ def print_color(
 
     """
 
-    if COLOR_SUPPORTED == False:
+    target = target or get_render_target(file)
+
+    if target == "ansi" and not get_terminal(file).enable_ansi():
         raise PluginError(
             """
 
@@ -516,6 +1248,94 @@ def print_color(
         """
         )
 
-    parsed_text = parse_color(text)
+    parsed_text = render(text, target, file)
 
     print(parsed_text, sep=sep, end=end, file=file, flush=flush)
+
+
+_cached_render_color = functools.lru_cache(maxsize=CACHE_SIZE)(render_color)
+
+
+def cache_info():
+    """
+    Return the statistics of the cache of `parse_color` as
+    `(hits, misses, maxsize, currsize)`.
+    """
+    return _cached_render_color.cache_info()
+
+
+def cache_clear():
+    """
+    Clear the cache of `parse_color`.
+    """
+    _cached_render_color.cache_clear()
+
+
+class CompiledMarkup:
+    """
+    A template whose color tags are rendered once. The template can contain
+    `str.format` placeholders that are filled by `format`. The values are
+    inserted as they are, their color tags are not rendered.
+
+    Parameters:
+    ---
+        template (str):
+            The template, for example: `[green]OK[/green] {message}`
+
+        target (str):
+            The render target, see `render`. By default it is
+            `get_render_target(file)`
+
+        file (IO[str]):
+            The file the template will be written to.
+
+    Attributes:
+    ---
+        segments (List[Tuple]):
+            The rendered template as `(literal, field, format spec, conversion)`
+            segments, the literal includes the ANSI codes (or the html).
+
+    """
+
+    __slots__ = ("template", "target", "segments", "__format")
+
+    def __init__(
+        self, template: str, target: Optional[str] = None, file: Optional[IO[str]] = None
+    ):
+        self.template = template
+        self.target = target or get_render_target(file)
+
+        #: The rendered template is a format string, the braces are not tags.
+        rendered = render(template, self.target, file)
+
+        self.segments = list(string.Formatter().parse(rendered))
+        self.__format = rendered.format
+
+    def format(self, *args: Any, **kwargs: Any) -> str:
+        """
+        Return the rendered template with the placeholders filled.
+        """
+        return self.__format(*args, **kwargs)
+
+    __call__ = format
+
+    def __repr__(self):
+        return "<CompiledMarkup %r>" % (self.template)
+
+
+def compile_markup(
+    template: str, target: Optional[str] = None, file: Optional[IO[str]] = None
+) -> CompiledMarkup:
+    """
+    Compile the color tags of a template for a render target (see `render`).
+    Use it for the templates that are printed repeatedly.
+
+    Example:
+    ---
+
+        >>> ok = compile_markup('[green]OK[/green] {}')
+        >>> for name in files:
+        >>>     print(ok.format(name))
+
+    """
+    return CompiledMarkup(template, target, file)
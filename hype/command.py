@@ -1,11 +1,18 @@
 import optparse
 from os import name
 from typing import Any, Dict
+from typing import Callable
 from typing import Optional
 from typing import List
 from typing import Tuple
+import sys
 import textwrap
 
+from .help import HelpCacheMixin
+from .help import HelpStore
+from .help import get_digest
+from .help import get_help_width
+
 
 
 class HypeArgument:
@@ -33,19 +40,27 @@ class HypeArgument:
         self.type = self.__metavar_mapping[type] if type else None
         
 
-class HypeOptionParser(optparse.OptionParser):
+class HypeOptionParser(HelpCacheMixin, optparse.OptionParser):
     """
     This is a parser inherited by `optparse.OptionParser`
     with some minor changes and adding arguments as well as 
     including help formatter.
     """
     __args = []
-    def __init__(self, arguments: List[Any], *args, **options):
+    def __init__(
+        self,
+        arguments: List[Any],
+        *args,
+        help_store: Optional[HelpStore] = None,
+        **options
+    ):
         super(HypeOptionParser, self).__init__(*args, **options)
+
+        self.help_store = help_store
         
         self.options = options
-        self.arguments = arguments
-        
+        self.arguments = arguments if arguments is not None else []
+
         if self.arguments:
             self.usage = "%prog [ARGS] [OPTIONS]"
         else:
@@ -56,10 +71,20 @@ class HypeOptionParser(optparse.OptionParser):
     def add_argument(self, argument):
         if not isinstance(argument, HypeArgument):
             raise ValueError('{} is not a instance of HypeArgument'.format(argument))
-        
+
+        if self.usage == "%prog [OPTIONS]":
+            self.usage = "%prog [ARGS] [OPTIONS]"
+
+        self.clear_help()
+
         return self.arguments.append(argument)
 
-    def format_help(self, formatter=None):
+    def help_inputs(self) -> list:
+        return super(HypeOptionParser, self).help_inputs() + [
+            [(arg.name, arg.type, arg.help) for arg in self.arguments]
+        ]
+
+    def render_help(self, formatter=None):
         output = optparse.OptionParser.format_help(self, formatter)
         result = []
         display_names = []
@@ -132,6 +157,11 @@ class HypeCommand:
         aliases (tuple):
             Aliases of the command.
 
+        help_source (str):
+            Where the options added by the builder come from (e.g. the import
+            path of the function). The stored help is only used for the same
+            source.
+
 
     Example:
 
@@ -149,17 +179,96 @@ class HypeCommand:
         aliases: Optional[Tuple[Any]] = None,
         help: Optional[str] = None,
         args: Optional[List[Any]] = None,
+        builder: Optional[Callable[["HypeCommand"], Any]] = None,
+        help_store: Optional[HelpStore] = None,
+        help_source: Optional[str] = None,
     ):
         self.name = name
         self.usage = usage
-        self.aliases = aliases
         self.help = help or "This command accept a positional arguments"
         self.args = args
-        self.parser = HypeOptionParser(self.args)
-        
 
-        if self.usage:
-            self.parser.usage = self.usage
+        #: The program name shown in the usage, set by the HypeParser.
+        self.prog = None
+
+        #: The persistent store of the rendered help, if any.
+        self.help_store = help_store
+        self.help_source = help_source
+
+        #: A single alias can be passed as a string, for example: ('?')
+        if isinstance(aliases, str):
+            aliases = (aliases,)
+
+        self.aliases = tuple(aliases or ())
+
+        #: The option parser is built on first access. The builder
+        #: (if any) is called once with the command to add the options.
+        self.__parser = None
+        self.__builder = builder
+
+    @property
+    def parser(self) -> HypeOptionParser:
+        """
+        The option parser of the command. It is only built when the
+        command is actually used (parsing or rendering its help).
+        """
+        if self.__parser is None:
+            self.__parser = HypeOptionParser(self.args, help_store=self.help_store)
+
+            if self.usage:
+                self.__parser.usage = self.usage
+
+            if self.__builder:
+                self.__builder(self)
+
+            self.__parser.command_inputs = self.help_digest()
+
+        if self.prog:
+            self.__parser.prog = self.prog
+
+        return self.__parser
+
+    @property
+    def _parser_built(self) -> bool:
+        """
+        Whether the parser was built. Overridden by the subclasses
+        that build another parser.
+        """
+        return self.__parser is not None
 
     def add_option(self, *args, **kwargs):
         return self.parser.add_option(*args, **kwargs)
+
+    def parse_args(self, args: List[str]):
+        """
+        Parse the arguments of the command. Return the options and
+        the positional arguments.
+        """
+        return self.parser.parse_args(args)
+
+    def help_digest(self) -> str:
+        """
+        Return the digest of what the help of the command is built from,
+        before its option parser is built.
+        """
+        args = [(arg.name, arg.type, arg.help) for arg in self.args or ()]
+
+        return get_digest(
+            [self.name, self.usage, self.help, self.aliases, args, self.help_source]
+        )
+
+    def print_help(self):
+        """
+        Print the help of the command. The stored help is printed
+        without building the option parser of the command.
+        """
+        if not self._parser_built and self.help_store and self.prog:
+            text = self.help_store.get(
+                self.prog, get_help_width(), inputs=self.help_digest()
+            )
+
+            if text is not None:
+                sys.stdout.write(text)
+                return
+
+        self.parser.print_help()
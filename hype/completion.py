@@ -0,0 +1,257 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+#: Shell completion for Hype applications. The completions are answered
+#: from a tree of the registered command names, aliases and options, never
+#: from the command parsers. The tree is cached on disk so `fast_complete`
+#: can answer before the application (and its commands) are imported.
+#:
+#: Install the completion with:
+#:      eval "$(_HYPE_COMPLETE=bash_source mytool)"
+#:      eval "$(_HYPE_COMPLETE=zsh_source mytool)"
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TextIO
+import hashlib
+import json
+import os
+import re
+import sys
+
+from .manifest import sources_changed
+
+COMPLETE_VAR = "_HYPE_COMPLETE"
+
+BASH_SOURCE = """\
+_%(func)s_completion() {
+    local IFS=$'\\n'
+    COMPREPLY=( $( env COMP_WORDS="${COMP_WORDS[*]}" \\
+                   COMP_CWORD=$COMP_CWORD \\
+                   %(var)s=complete "$1" ) )
+    return 0
+}
+
+complete -o default -F _%(func)s_completion %(prog)s
+"""
+
+ZSH_SOURCE = """\
+#compdef %(prog)s
+
+_%(func)s_completion() {
+    local -a completions
+    completions=( ${(f)"$(env COMP_WORDS="${words[*]}" \\
+                          COMP_CWORD=$((CURRENT-1)) \\
+                          %(var)s=complete "${words[1]}")"} )
+    compadd -a completions
+}
+
+compdef _%(func)s_completion %(prog)s
+"""
+
+SOURCES = {"bash_source": BASH_SOURCE, "zsh_source": ZSH_SOURCE}
+
+
+def get_completions(tree: dict, words: List[str], cword: int) -> List[str]:
+    """
+    Return the completions of the word at `cword`.
+
+    Parameters:
+    ---
+        tree (dict):
+            The command tree. A group is `{"commands": {...}, "aliases": {...}}`
+            and a command is `{"options": [...]}`
+
+        words (List[str]):
+            The words of the command line, including the program name.
+
+        cword (int):
+            The index of the word to be completed.
+    """
+    node = tree
+    incomplete = words[cword] if cword < len(words) else ""
+
+    for word in words[1:cword]:
+        if word.startswith("-") or "commands" not in node:
+            continue
+
+        name = node["aliases"].get(word, word)
+
+        if name in node["commands"]:
+            node = node["commands"][name]
+
+    if incomplete.startswith("-"):
+        candidates = node.get("options", []) + ["--help"]
+
+    elif "commands" in node:
+        candidates = list(node["commands"]) + list(node["aliases"]) + ["help"]
+
+    else:
+        candidates = []
+
+    return [c for c in candidates if c.startswith(incomplete)]
+
+
+def get_prog_name() -> str:
+    return os.path.basename(sys.argv[0])
+
+
+def get_identity() -> str:
+    """
+    Return a hash of the absolute path of the script and `sys.prefix`,
+    so two programs with the same name (or the same program installed
+    in two environments) do not share a cache.
+    """
+    script = os.path.abspath(sys.argv[0])
+
+    return hashlib.sha1(
+        ("%s\0%s" % (script, sys.prefix)).encode("utf-8")
+    ).hexdigest()
+
+
+def get_cache_path(prog: str) -> str:
+    """
+    Return the path of the completion cache of the program.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+
+    return os.path.join(
+        cache_home, "hype", "%s-%s.completion.json" % (prog, get_identity()[:16])
+    )
+
+
+def read_cache(prog: str) -> Optional[dict]:
+    """
+    Read the command tree from the cache. Return None if it does not
+    exist, was written by another program or one of its source files
+    was modified.
+    """
+    try:
+        with open(get_cache_path(prog), encoding="utf-8") as f:
+            cache = json.load(f)
+
+    except (OSError, ValueError):
+        return None
+
+    if cache.get("identity") != get_identity():
+        return None
+
+    if sources_changed(cache["sources"]):
+        return None
+
+    return cache["tree"]
+
+
+def write_cache(prog: str, tree: dict, sources: Dict[str, int]):
+    """
+    Write the command tree to the cache. Errors are ignored since the
+    cache is only an optimization.
+    """
+    path = get_cache_path(prog)
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"identity": get_identity(), "sources": sources, "tree": tree}, f
+            )
+
+    except OSError:
+        pass
+
+
+def respond(tree: dict, stream: TextIO):
+    """
+    Write the completions of `COMP_WORDS` and `COMP_CWORD` to the stream.
+    """
+    words = os.environ.get("COMP_WORDS", "").split()
+    cword = int(os.environ.get("COMP_CWORD", 0) or 0)
+
+    stream.write("\n".join(get_completions(tree, words, cword)))
+    stream.write("\n")
+
+
+def complete(
+    tree: dict, sources: Dict[str, int], stream: Optional[TextIO] = None
+) -> bool:
+    """
+    Run the completion mode from the `_HYPE_COMPLETE` environment variable.
+    Used by `Hype.run`, the tree is written to the cache for `fast_complete`.
+
+    Return False if the completion mode is not enabled.
+    """
+    mode = os.environ.get(COMPLETE_VAR)
+    stream = stream or sys.stdout
+    prog = get_prog_name()
+
+    if not mode:
+        return False
+
+    if mode in SOURCES:
+        stream.write(
+            SOURCES[mode]
+            % {
+                "prog": prog,
+                "func": re.sub(r"\W", "_", prog),
+                "var": COMPLETE_VAR,
+            }
+        )
+
+    elif mode == "complete":
+        respond(tree, stream)
+
+        if read_cache(prog) != tree:
+            write_cache(prog, tree, sources)
+
+    return True
+
+
+def fast_complete(stream: Optional[TextIO] = None) -> bool:
+    """
+    Answer the completion from the cache without importing the application.
+    Call it at the top of the script, before the commands are imported.
+
+    Return False if the completion mode is not enabled or the cache is
+    missing (or outdated). In that case `Hype.run` answers the completion.
+
+    Example:
+    ---
+        >>> import sys
+        >>> from hype.completion import fast_complete
+        >>> if fast_complete():
+        >>>     sys.exit()
+        >>> ...
+        >>> from mycli.app import app
+    """
+    if os.environ.get(COMPLETE_VAR) != "complete":
+        return False
+
+    tree = read_cache(get_prog_name())
+
+    if tree is None:
+        return False
+
+    respond(tree, stream or sys.stdout)
+
+    return True
@@ -1,13 +1,10 @@
-from hype.errors import PluginError
 from .style import Background, Color
 from .style import Style
 
-try:
-    import hype.color
-
-    COLOR_SUPPORTED = True
-except PluginError:
-    COLOR_SUPPORTED = False
+#: The color tags are always rendered, colorama is only needed on the
+#: Windows consoles without escape code support (see `hype.terminal`).
+#: `hype.color` is not imported here to keep the import of hype cheap.
+COLOR_SUPPORTED = True
 
 rule_colors = {
     "red": Color.RED,
@@ -54,6 +51,8 @@ all_tags = [
     "yellow",
     "white",
     "reset",
+    #: hex, rgb and 256 colors
+    "color",
     #: background
     "bg",
     #: styles
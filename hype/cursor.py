@@ -30,7 +30,7 @@ if os.name == "nt":
         _fields_ = [("size", ctypes.c_int), ("visible", ctypes.c_byte)]
 
 
-def hide(stream: Optional[TextIO] = sys.stdout):
+def hide(stream: Optional[TextIO] = None):
     """
     Hide the cursor.
     Parameters
@@ -47,11 +47,12 @@ def hide(stream: Optional[TextIO] = sys.stdout):
         ctypes.windll.kernel32.SetConsoleCursorInfo(handle, ctypes.byref(ci))
 
     elif os.name == "posix":
+        stream = stream or sys.stdout
         stream.write("\033[?25l")
         stream.flush()
 
 
-def show(stream: Optional[TextIO] = sys.stdout):
+def show(stream: Optional[TextIO] = None):
     """
     Show cursor.
 
@@ -69,5 +70,6 @@ def show(stream: Optional[TextIO] = sys.stdout):
         ctypes.windll.kernel32.SetConsoleCursorInfo(handle, ctypes.byref(ci))
 
     elif os.name == "posix":
+        stream = stream or sys.stdout
         stream.write("\033[?25h")
         stream.flush()
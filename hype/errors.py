@@ -33,3 +33,12 @@ class TagNotFound(HypeException):
 
     def __init__(self, msg="Tag is not defined"):
         super().__init__(msg)
+
+
+class CommandConflict(HypeException):
+    """
+    Used when a command name or alias is already registered in `hype.parser.HypeParser`
+    """
+
+    def __init__(self, msg="The command name is already registered"):
+        super().__init__(msg)
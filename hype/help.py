@@ -0,0 +1,251 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+#: Caching of the rendered help of the parsers. The help is cached in memory
+#: per parser and can be persisted between runs with a `HelpStore`.
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+import hashlib
+import json
+import os
+
+from .manifest import sources_changed
+
+STORE_VERSION = 2
+
+
+def get_digest(inputs: Any) -> str:
+    """
+    Return a digest of the inputs of a help text (names, aliases, help
+    strings, usage, ...), given as nested tuples, lists and strings.
+    """
+    return hashlib.sha1(repr(inputs).encode("utf-8")).hexdigest()
+
+
+def get_help_width() -> int:
+    """
+    Return the help width the same way `optparse.HelpFormatter` does.
+    """
+    try:
+        return int(os.environ["COLUMNS"]) - 2
+    except (KeyError, ValueError):
+        return 78
+
+
+class HelpStore:
+    """
+    A json file of rendered help texts, keyed by the program name and
+    the width. A text is only returned for the same inputs (see
+    `get_digest`) and the file is discarded when one of its source files
+    is modified.
+
+    Parameters:
+    ---
+        path (str):
+            The path of the file.
+
+        sources (Callable):
+            Return the source files of the help texts, as
+            `{path: modification time}`. Called when the file is written.
+
+    """
+
+    def __init__(self, path: str, sources: Callable[[], Dict[str, int]]):
+        self.path = path
+        self.sources = sources
+        self.__help = None
+        self.__sources = {}
+
+    def __load(self) -> dict:
+        if self.__help is None:
+            self.__help = {}
+
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    store = json.load(f)
+
+                if store.get("version") == STORE_VERSION and not sources_changed(
+                    store["sources"]
+                ):
+                    self.__help = store["help"]
+                    self.__sources = store["sources"]
+
+            except (OSError, ValueError, KeyError):
+                pass
+
+        return self.__help
+
+    @staticmethod
+    def key(prog: str, width: int) -> str:
+        return "%s:%s" % (prog, width)
+
+    def get(
+        self,
+        prog: str,
+        width: int,
+        digest: Optional[str] = None,
+        inputs: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Return the stored help, or None. The help is returned if it was
+        rendered from the same parser (`digest`, see `HelpCacheMixin`) or
+        from the same command before its parser was built (`inputs`).
+        """
+        entry = self.__load().get(self.key(prog, width))
+
+        if entry is None:
+            return None
+
+        if (digest and entry["digest"] == digest) or (
+            inputs and entry["inputs"] == inputs
+        ):
+            return entry["text"]
+
+        return None
+
+    def set(
+        self,
+        prog: str,
+        width: int,
+        text: str,
+        digest: str,
+        inputs: Optional[str] = None,
+    ):
+        """
+        Store the help and write the file. Errors are ignored since
+        the store is only an optimization.
+        """
+        help = self.__load()
+        entry = {"digest": digest, "inputs": inputs, "text": text}
+
+        if help.get(self.key(prog, width)) == entry:
+            return
+
+        help[self.key(prog, width)] = entry
+
+        #: Keep the sources of the help stored by the previous runs.
+        self.__sources.update(self.sources())
+
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": STORE_VERSION, "sources": self.__sources, "help": help},
+                    f,
+                )
+
+        except OSError:
+            pass
+
+
+class HelpCacheMixin:
+    """
+    Cache the output of `format_help` of an `optparse.OptionParser`.
+    The subclass must provide `render_help(formatter=None)`, which renders
+    the help, and calls `clear_help` whenever something shown in the help
+    changes. The cache is keyed by
+    everything else shown in the help: the program name, the width,
+    the usage, the description and the epilog.
+
+    The help is persisted in `help_store` with a digest of the inputs of
+    `help_inputs`, so a parser changed at runtime (a command added, an
+    option removed, ...) never gets the help of another run.
+
+    Only the default formatter is cached.
+    """
+
+    #: The persistent store of the help, if any.
+    help_store = None
+
+    #: The digest of the command the parser was built from, set by
+    #: `HypeCommand` once its builder ran and reset by any change.
+    command_inputs = None
+
+    def clear_help(self):
+        """
+        Clear the cached help.
+        """
+        self._help_cache = {}
+        self.command_inputs = None
+
+    def help_inputs(self) -> list:
+        """
+        Return everything shown in the help, besides the program name and
+        the width. Subclasses add what they render in `render_help`.
+        """
+        options = []
+
+        for option in self._get_all_options():
+            help = option.help or ""
+            default = option.default if "%default" in help else None
+            options.append((str(option), help, option.metavar, repr(default)))
+
+        return [
+            self.usage,
+            self.description,
+            self.epilog,
+            type(self.formatter).__name__,
+            [(group.title, group.description) for group in self.option_groups],
+            options,
+        ]
+
+    def format_help(self, formatter=None) -> str:
+        if formatter is not None:
+            return self.render_help(formatter)
+
+        if getattr(self, "_help_cache", None) is None:
+            self._help_cache = {}
+
+        cache = self._help_cache
+        prog = self.get_prog_name()
+        key = (prog, self.formatter.width, self.usage, self.description, self.epilog)
+
+        if key not in cache:
+            text = None
+
+            if self.help_store:
+                digest = get_digest(self.help_inputs())
+                text = self.help_store.get(prog, self.formatter.width, digest)
+
+            if text is None:
+                text = self.render_help()
+
+                if self.help_store:
+                    self.help_store.set(
+                        prog, self.formatter.width, text, digest, self.command_inputs
+                    )
+
+            cache[key] = text
+
+        return cache[key]
+
+    def add_option(self, *args, **kwargs):
+        self.clear_help()
+        return super(HelpCacheMixin, self).add_option(*args, **kwargs)
+
+    def remove_option(self, *args, **kwargs):
+        self.clear_help()
+        return super(HelpCacheMixin, self).remove_option(*args, **kwargs)
+
+    def add_option_group(self, *args, **kwargs):
+        self.clear_help()
+        return super(HelpCacheMixin, self).add_option_group(*args, **kwargs)
@@ -0,0 +1,74 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+#: Lazy loading of the public names of a package. The submodule of a name
+#: is only imported when the name is used, so `import hype` stays cheap.
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+import importlib
+import sys
+
+
+def lazy_attributes(
+    package: str, attributes: Dict[str, str]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Return the module `__getattr__` and `__dir__` functions of a package
+    whose attributes are imported on first access.
+
+    Parameters:
+    ---
+        package (str):
+            The name of the package, `__name__`
+
+        attributes (Dict[str, str]):
+            The attribute names to their submodule, as `.module` or
+            `.module:name` when the name in the submodule differs.
+
+    Example:
+    ---
+
+        >>> __getattr__, __dir__ = lazy_attributes(__name__, {
+        ...     "Hype": ".app",
+        ...     "hide_cursor": ".cursor:hide",
+        ... })
+
+    """
+
+    def __getattr__(name: str):
+        if name not in attributes:
+            raise AttributeError("module %r has no attribute %r" % (package, name))
+
+        module, _, attribute = attributes[name].partition(":")
+        value = getattr(importlib.import_module(module, package), attribute or name)
+
+        #: The next access does not go through __getattr__
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(sys.modules[package].__dict__) | set(attributes))
+
+    return __getattr__, __dir__
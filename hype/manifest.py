@@ -0,0 +1,165 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+#: The command manifest is a json file of the resolved commands of an
+#: application. Loading it registers every command lazily, so neither the
+#: command modules nor `inspect.signature` are needed on startup.
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+import json
+import os
+import sys
+
+MANIFEST_VERSION = 2
+
+#: The option types that can be written to the manifest.
+MANIFEST_TYPES = {t.__name__: t for t in (str, int, float)}
+
+
+def get_target(func: Any) -> str:
+    """
+    Return the import path `module:qualname` of the function.
+    """
+    if func.__module__ == "__main__" or "<locals>" in func.__qualname__:
+        raise ValueError(
+            "%s cannot be written to the manifest, it is not importable."
+            % (func.__qualname__)
+        )
+
+    return "%s:%s" % (func.__module__, func.__qualname__)
+
+
+def get_sources(modules: Iterable[str]) -> Dict[str, int]:
+    """
+    Return the modification time of the source file of each module.
+    """
+    sources = {}
+
+    for name in modules:
+        path = getattr(sys.modules.get(name), "__file__", None)
+
+        if path:
+            sources[path] = os.stat(path).st_mtime_ns
+
+    return sources
+
+
+def sources_changed(sources: Dict[str, int]) -> bool:
+    """
+    Return True if a source file was modified (or removed).
+    """
+    for source, mtime in sources.items():
+        try:
+            if os.stat(source).st_mtime_ns != mtime:
+                return True
+
+        except OSError:
+            return True
+
+    return False
+
+
+def dump_option(option: dict) -> dict:
+    """
+    Convert a `ParamOption.to_dict` to a json compatible dict.
+    """
+    option = dict(option)
+
+    if option["type"] is not None:
+        if MANIFEST_TYPES.get(option["type"].__name__) is not option["type"]:
+            raise ValueError(
+                "The type of %s cannot be written to the manifest." % (option["name"])
+            )
+
+        option["type"] = option["type"].__name__
+
+    return option
+
+
+def load_option(option: dict) -> dict:
+    """
+    Convert an option of the manifest back to a `ParamOption.to_dict`
+    """
+    if option["type"] is not None:
+        option["type"] = MANIFEST_TYPES[option["type"]]
+
+    return option
+
+
+def write_manifest(
+    path: str, commands: List[dict], groups: List[dict], sources: Dict[str, int]
+):
+    """
+    Write the manifest file.
+
+    Parameters:
+    ---
+        path (str):
+            The path of the manifest file.
+
+        commands (List[dict]):
+            The commands as `{name, usage, help, aliases, target, options, group}`
+
+        groups (List[dict]):
+            The groups as `{name, usage, help, aliases, group}`
+
+        sources (Dict[str, int]):
+            The source files the manifest was generated from.
+    """
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "sources": sources,
+        "commands": commands,
+        "groups": groups,
+    }
+
+    try:
+        data = json.dumps(manifest, indent=1)
+    except TypeError as err:
+        raise ValueError("The manifest cannot be written: %s" % (err))
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(data)
+
+
+def read_manifest(path: str) -> Optional[Tuple[List[dict], List[dict]]]:
+    """
+    Read the commands and groups from the manifest file. Return None if the manifest
+    does not exist, is from another version or a source file was modified.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+
+    if sources_changed(manifest["sources"]):
+        return None
+
+    return manifest["commands"], manifest["groups"]
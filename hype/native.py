@@ -0,0 +1,253 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+#: The native parser engine. The options of a command are compiled into a
+#: flat table (option string and unique long option prefix -> option) and
+#: the arguments are parsed in a single pass straight into the list of the
+#: option values, without `optparse.Option` or `optparse.Values` objects.
+#: The optparse parser of the command is still used to render its help.
+
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .command import HypeCommand
+from .errors import OptionError
+from .help import HelpStore
+from .utils import ParamOption
+from .utils import create_bool_option
+
+#: The converters of the option types and their names in the error messages.
+CONVERTERS = {
+    None: (str, "string"),
+    str: (str, "string"),
+    int: (int, "integer"),
+    float: (float, "floating-point"),
+    complex: (complex, "complex"),
+}
+
+#: The entry of the help option in the table.
+HELP = object()
+
+
+class NativeSpec:
+    """
+    The compiled options of a command.
+
+    Parameters:
+    ---
+        options (List[ParamOption]):
+            The options of the command.
+
+    Example:
+    ---
+        >>> spec = NativeSpec([ParamOption('--times', True, None, int, 'times')])
+        >>> spec.parse(['--times', '2', 'rest'])
+        ([2], ['rest'])
+    """
+
+    __slots__ = ("table", "defaults", "required")
+
+    def __init__(self, options: List[ParamOption]):
+
+        #: option string -> (index, converter, type name, flag value)
+        #: or a list of the matching option strings for ambiguous prefixes.
+        self.table = {"-h": HELP, "--help": HELP}
+        self.defaults = []
+        self.required = []
+
+        for index, option in enumerate(options):
+            if option.action:
+                #: --flag / --no-flag pair, the default comes from the signature.
+                on, off = create_bool_option(option.name)
+                self.table[on] = (index, None, None, True)
+                self.table[off] = (index, None, None, False)
+                self.defaults.append(bool(option.default))
+                continue
+
+            if option.type not in CONVERTERS:
+                raise OptionError("invalid option type: %r" % (option.type,))
+
+            converter, type_name = CONVERTERS[option.type]
+            self.table[option.name] = (index, converter, type_name, None)
+            self.defaults.append(option.default)
+
+            if option.required:
+                self.required.append((index, option.dest))
+
+        #: Unique prefixes of the long options, like optparse abbreviations.
+        prefixes = {}
+        for name in [name for name in self.table if name.startswith("--")]:
+            for end in range(3, len(name)):
+                prefixes.setdefault(name[:end], []).append(name)
+
+        for names in prefixes.values():
+            names.sort()
+
+        for prefix, names in prefixes.items():
+            if prefix not in self.table:
+                self.table[prefix] = self.table[names[0]] if len(names) == 1 else names
+
+    def parse(self, args: List[str]) -> Tuple[List[Any], List[str]]:
+        """
+        Parse the arguments. Return the option values (in the order of the
+        options) and the positional arguments. Just like the optparse
+        parser of the command, parsing stops at the first positional argument.
+
+        Raise `OptionError` on an invalid option and return `(None, None)`
+        when the help was requested.
+        """
+        values = list(self.defaults)
+        table = self.table
+        count = len(args)
+        i = 0
+
+        while i < count:
+            arg = args[i]
+
+            if arg == "--":
+                i += 1
+                break
+
+            if arg[:1] != "-" or arg == "-":
+                break
+
+            if arg[:2] == "--":
+                name, sep, value = arg.partition("=")
+            else:
+                #: -x, -xVALUE or clustered flags -abc
+                name, value = arg[:2], arg[2:]
+                sep = value != ""
+
+            entry = table.get(name)
+
+            if entry is None:
+                raise OptionError("no such option: %s" % (name))
+
+            if entry is HELP:
+                return None, None
+
+            if entry.__class__ is list:
+                raise OptionError(
+                    "ambiguous option: %s (%s?)" % (name, ", ".join(entry))
+                )
+
+            index, converter, type_name, flag = entry
+
+            if flag is not None:
+                if sep and arg[:2] == "--":
+                    raise OptionError("%s option does not take a value" % (name))
+
+                values[index] = flag
+
+                if sep:
+                    #: The remaining clustered short flags
+                    args = args[:i] + ["-" + value] + args[i + 1 :]
+                    count = len(args)
+                    continue
+
+                i += 1
+                continue
+
+            if not sep:
+                i += 1
+
+                if i >= count:
+                    raise OptionError("%s option requires 1 argument" % (name))
+
+                value = args[i]
+
+            try:
+                values[index] = converter(value)
+            except ValueError:
+                raise OptionError(
+                    "option %s: invalid %s value: %r" % (name, type_name, value)
+                )
+
+            i += 1
+
+        for index, dest in self.required:
+            if values[index] is None:
+                raise OptionError("Option: {} is required.".format(dest))
+
+        return values, args[i:]
+
+
+class NativeCommand(HypeCommand):
+    """
+    A HypeCommand parsed by the native engine. The option parser of
+    the command (see `HypeCommand`) is only built to render the help.
+
+    Parameters:
+
+        Same as `HypeCommand` and:
+
+        options (Callable):
+            Return the options of the command.
+            Called once, when the command is parsed for the first time.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        usage: Optional[str] = None,
+        aliases: Optional[Tuple[Any]] = None,
+        help: Optional[str] = None,
+        args: Optional[List[Any]] = None,
+        builder: Optional[Callable[[HypeCommand], Any]] = None,
+        options: Optional[Callable[[], List[ParamOption]]] = None,
+        help_store: Optional[HelpStore] = None,
+        help_source: Optional[str] = None,
+    ):
+        super(NativeCommand, self).__init__(
+            name, usage, aliases, help, args, builder, help_store, help_source
+        )
+
+        self.__spec = None
+        self.__options = options
+
+    @property
+    def spec(self) -> NativeSpec:
+        """
+        The compiled options of the command.
+        """
+        if self.__spec is None:
+            self.__spec = NativeSpec(self.__options() if self.__options else [])
+
+        return self.__spec
+
+    def parse_args(self, args: List[str]):
+        """
+        Parse the arguments. Return the list of the option values (in
+        the order of the function parameters) and the positional arguments.
+        """
+        try:
+            values, positional = self.spec.parse(args)
+        except OptionError as err:
+            self.parser.error(str(err))
+
+        if values is None:
+            self.print_help()
+            self.parser.exit()
+
+        return values, positional
@@ -19,14 +19,21 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+from typing import Any
+from typing import Callable
 from typing import List
+from typing import Optional
+from typing import Tuple
 from hype.command import HypeCommand
+from hype.errors import CommandConflict
+from hype.help import HelpCacheMixin
+from hype.help import HelpStore
 import optparse
 from optparse import HelpFormatter
 import sys
 import textwrap
 
-class HypeParser(optparse.OptionParser):
+class HypeParser(HelpCacheMixin, optparse.OptionParser):
     """
     A command parser for Hype CLI that was built on the top of 
     `optparse.OptionParser` This parser is pretty simmilar with 
@@ -59,19 +66,24 @@ class HypeParser(optparse.OptionParser):
         self, 
         commands: List[HypeCommand] = [], 
         *args, 
+        help_store: Optional[HelpStore] = None,
         **options
     ):
-        
-        self.commands = commands
+        self.help_store = help_store
+
+        self.commands = []
         self.options = options
 
+        #: The command (and alias) names to the command.
+        self.__index = {}
+
         if 'usage' not in self.options:
             self.options['usage'] = "%prog COMMAND [ARGS..]\n%prog help COMMAND"
 
         super(HypeParser, self).__init__(*args, **options)
 
-        for command in self.commands:
-            command.parser.prog = "%s %s" % (self.get_prog_name(), command.name)
+        for command in commands:
+            self.add_command(command)
 
         self.disable_interspersed_args()
 
@@ -95,7 +107,21 @@ class HypeParser(optparse.OptionParser):
         if not isinstance(cmd, HypeCommand):
             raise TypeError('{} is not a instance of HypeCommand'.format(cmd))
 
+        names = (cmd.name,) + cmd.aliases
+
+        for name in names:
+            if name in self.__index:
+                raise CommandConflict(
+                    '{} is already registered by the command {}'.format(
+                        name, self.__index[name].name
+                    )
+                )
+
+        for name in names:
+            self.__index[name] = cmd
+
         self.commands.append(cmd)
+        self.clear_help()
 
     def remove_command(self, name: str):
         """
@@ -116,12 +142,24 @@ class HypeParser(optparse.OptionParser):
 
         """
 
-        for command in self.commands:
-            if command.name == name:
-                self.commands.remove(command)
+        command = self.__index.get(name)
+
+        if command is None or command.name != name:
+            return
+
+        for name in (command.name,) + command.aliases:
+            self.__index.pop(name, None)
+
+        self.commands.remove(command)
+        self.clear_help()
 
 
-    def format_help(self, formatter=None) -> str:
+    def help_inputs(self) -> list:
+        return super(HypeParser, self).help_inputs() + [
+            [(command.name, command.aliases, command.help) for command in self.commands]
+        ]
+
+    def render_help(self, formatter=None) -> str:
         out = optparse.OptionParser.format_help(self, formatter)
         
         if formatter == None:
@@ -188,18 +226,15 @@ class HypeParser(optparse.OptionParser):
 
         """ 
 
-        _command = None
+        return self.__index.get(name)
 
-        for command in self.commands: 
-            try:
-            
-                if name == command.name or name in command.aliases:
-                    _command = command
-            
-            except TypeError:
-                pass
+    def __prepare(self, command: HypeCommand) -> HypeCommand:
+        """
+        Set the program name of the command to `prog command`.
+        """
+        command.prog = "%s %s" % (self.get_prog_name(), command.name)
 
-        return _command
+        return command
 
     def parse_args(self, _args=None, _value=None):
         """
@@ -232,7 +267,9 @@ class HypeParser(optparse.OptionParser):
             ...    command_opt, command_args = parser.parse_args()
     
         """
-        self.commands.insert(len(self.commands), self._HelpCommand)
+        if 'help' not in self.__index:
+            self.add_command(self._HelpCommand)
+
         options, args = optparse.OptionParser.parse_args(self, _args, _value)
 
         if not args:
@@ -247,7 +284,11 @@ class HypeParser(optparse.OptionParser):
             if not command:
                 self.error('Unknown Command: {}'.format(command_name))
 
-        command_opt, command_args = command.parser.parse_args(args)
+        if isinstance(command, HypeGroup):
+            #: Only the branch named in the arguments is parsed (and built).
+            return self.__prepare(command).parse_args(args)
+
+        command_opt, command_args = self.__prepare(command).parse_args(args)
 
         if command is self._HelpCommand:
             if command_args:
@@ -256,7 +297,17 @@ class HypeParser(optparse.OptionParser):
 
                 #: Check for the help command on the command arguments.
                 helpcommand = self.__command_for_name(command_name)
-                helpcommand.parser.print_help()
+
+                if not helpcommand:
+                    self.error('Unknown Command: {}'.format(command_name))
+
+                if isinstance(helpcommand, HypeGroup) and command_args[1:]:
+                    #: help GROUP COMMAND
+                    return self.__prepare(helpcommand).parse_args(
+                        ['help'] + command_args[1:]
+                    )
+
+                self.__prepare(helpcommand).print_help()
                 self.exit()
 
             else:
@@ -265,3 +316,100 @@ class HypeParser(optparse.OptionParser):
 
         
         return options, command, command_opt, command_args
+
+
+class HypeGroup(HypeCommand):
+    """
+    A command that holds sub commands, for example: `db migrate up`.
+    The parser of the group is a `HypeParser` that is only built (and
+    filled by the builder) when the group is selected.
+
+    Parameters:
+
+        name (str):
+            The name of the group
+
+        usage (str):
+            The usage format for the group
+
+        aliases (tuple):
+            Aliases of the group.
+
+        help (str):
+            The help for the group.
+
+        builder (Callable):
+            Called with the group when its parser is built. It should
+            add the sub commands with `add_command`
+
+        help_source (str):
+            Same as `HypeCommand`, e.g. the sub commands added by the builder.
+
+    Example:
+
+        >>> db = HypeGroup('db', help="Database commands")
+        >>> db.add_command(HypeCommand('migrate'))
+        >>> parser = HypeParser([db])
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        usage: Optional[str] = None,
+        aliases: Optional[Tuple[Any]] = None,
+        help: Optional[str] = None,
+        builder: Optional[Callable[["HypeGroup"], Any]] = None,
+        help_store: Optional[HelpStore] = None,
+        help_source: Optional[str] = None,
+    ):
+        super(HypeGroup, self).__init__(
+            name,
+            usage,
+            aliases,
+            help or "This command accept sub commands",
+            help_store=help_store,
+            help_source=help_source,
+        )
+
+        self.__parser = None
+        self.__builder = builder
+
+    @property
+    def parser(self) -> HypeParser:
+        """
+        The parser of the sub commands. It is built on first access.
+        """
+        if self.__parser is None:
+            options = {"usage": self.usage} if self.usage else {}
+            self.__parser = HypeParser([], help_store=self.help_store, **options)
+
+            if self.__builder:
+                self.__builder(self)
+
+            self.__parser.command_inputs = self.help_digest()
+
+        if self.prog:
+            self.__parser.prog = self.prog
+
+        return self.__parser
+
+    @property
+    def _parser_built(self) -> bool:
+        return self.__parser is not None
+
+    def parse_args(self, args: List[str]):
+        """
+        Parse the arguments of the group. Return the same values
+        as `HypeParser.parse_args`
+        """
+        return self.parser.parse_args(args)
+
+    def add_command(self, cmd: HypeCommand):
+        """
+        Add a sub command to the group.
+        """
+        return self.parser.add_command(cmd)
+
+    def add_option(self, *args, **kwargs):
+        return self.parser.add_option(*args, **kwargs)
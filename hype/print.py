@@ -22,15 +22,37 @@
 
 from typing import IO
 from typing import Any
+from typing import Iterable
 from typing import Optional
 from builtins import print as _print
 from .errors import PluginError
 import sys
+import time
 
-try:
-    from .color import print_color
-except PluginError:
-    print_color = None
+from .terminal import get_terminal
+
+#: hype.color is imported by the first print, see `_load_color`
+get_render_target = print_color = render = None
+_color_loaded = False
+
+
+def _load_color() -> bool:
+    """
+    Import hype.color. Return False if the color plugin is not available.
+    """
+    global get_render_target, print_color, render, _color_loaded
+
+    if not _color_loaded:
+        _color_loaded = True
+
+        try:
+            from .color import get_render_target
+            from .color import print_color
+            from .color import render
+        except PluginError:
+            pass
+
+    return render is not None
 
 
 def print(
@@ -39,15 +61,21 @@ def print(
     end: Optional[str] = "\n",
     file: Optional[IO[str]] = None,
     flush: Optional[bool] = False,
+    target: Optional[str] = None,
 ):
 
     """
     A wrapper for both color printing from `hype.color.print_color`
-    and a standart print function.
+    and a standart print function. The tags are removed (without
+    rendering any color) when the file is not a terminal, `NO_COLOR`
+    is set or the color plugin is not installed.
 
     Parameters:
     ---
-        Same as print().
+        Same as print() and:
+
+        target (str):
+            The render target, see `hype.color.render`
 
     Example:
     ---
@@ -58,10 +86,123 @@ def print(
 
     """
 
-    try:
+    if _load_color():
+        value = _render(value, _get_target(target, file), file)
+
+    _print(value, sep=sep, end=end, file=file, flush=flush)
+
+
+def _get_target(target: Optional[str], file: Optional[IO[str]]) -> Optional[str]:
+    target = target or get_render_target(file)
+
+    if target == "ansi" and not get_terminal(file).enable_ansi():
+        return "plain"
+
+    return target
+
 
-        print_color(value, sep=sep, end=end, file=file, flush=flush)
+def _render(value: Any, target: str, file: Optional[IO[str]] = None) -> Any:
+    try:
+        return render(value, target, file)
 
     except Exception:
+        #: Not a valid markup, it is printed as it is.
+        return value
+
+
+class Buffer:
+    """
+    Collect the printed values and write them at once, when the buffer is
+    flushed, instead of one write per value. The buffer is flushed when it
+    is full, when a value is printed `max_delay` seconds or more after the
+    last flush, when `flush` is called and when the context exits. There is
+    no timer: `max_delay` is only checked on the next print, so the values
+    stay buffered while nothing is printed.
+
+    Parameters:
+    ---
+        file (IO[str]):
+            The file to write to, `sys.stdout` by default.
+
+        max_size (int):
+            Flush when the buffered text is longer than that. Never if
+            it is None.
+
+        max_delay (float):
+            Flush when a value is printed `max_delay` seconds or more
+            after the last flush (checked on the next print, not by a
+            timer). Never if it is None.
+
+        target (str):
+            The render target, see `hype.color.render`
+
+    Example:
+    ---
+
+        >>> from hype.print import Buffer
+        >>> with Buffer() as buffer:
+        >>>     for name in files:
+        >>>         buffer.print('[green]OK[/green] %s' % (name))
+
+    """
 
-        _print(value, sep=sep, end=end, file=file, flush=flush)
+    def __init__(
+        self,
+        file: Optional[IO[str]] = None,
+        max_size: Optional[int] = 64 * 1024,
+        max_delay: Optional[float] = None,
+        target: Optional[str] = None,
+    ):
+        self.file = file
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.target = _get_target(target, file) if _load_color() else None
+
+        self.__parts = []
+        self.__size = 0
+        self.__flushed = time.monotonic()
+
+    def print(self, value: Any, end: Optional[str] = "\n"):
+        """
+        Add the rendered value to the buffer.
+        """
+        if self.target is not None:
+            value = _render(value, self.target, self.file)
+
+        text = str(value) + (end if end is not None else "\n")
+
+        self.__parts.append(text)
+        self.__size += len(text)
+
+        if (self.max_size is not None and self.__size >= self.max_size) or (
+            self.max_delay is not None
+            and time.monotonic() - self.__flushed >= self.max_delay
+        ):
+            self.flush()
+
+    def print_many(self, values: Iterable[Any], end: Optional[str] = "\n"):
+        """
+        Add the rendered values to the buffer.
+        """
+        for value in values:
+            self.print(value, end=end)
+
+    def flush(self):
+        """
+        Write the buffered text and flush the file.
+        """
+        file = self.file or sys.stdout
+
+        if self.__parts:
+            file.write("".join(self.__parts))
+            self.__parts = []
+            self.__size = 0
+
+        file.flush()
+        self.__flushed = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
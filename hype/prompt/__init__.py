@@ -18,9 +18,20 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from .password import Password
-from .confirm import Confirm
-from .input import Input
+from hype.lazy import lazy_attributes
+
+#: `error` is not lazy, the import of `hype.prompt.error` (by the
+#: other prompts) would replace the function by the module.
 from .error import error
 
+#: The other names are imported on first access.
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Password": ".password",
+        "Confirm": ".confirm",
+        "Input": ".input",
+    },
+)
+
 __all__ = ["Password", "Confirm", "Input", "error"]
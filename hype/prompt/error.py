@@ -58,8 +58,8 @@ def pprint(x: int, y: int, text: str):
 def error(
     msg: Optional[str] = "An error occured.",
     duration: Optional[int] = 3,
-    height: Optional[int] = os.get_terminal_size().lines,
-    width: Optional[int] = os.get_terminal_size().columns,
+    height: Optional[int] = None,
+    width: Optional[int] = None,
 ):
 
     """
@@ -83,6 +83,12 @@ def error(
 
     """
 
+    #: The size is read on call, not when the module is imported.
+    if height is None or width is None:
+        size = os.get_terminal_size()
+        height = height or size.lines
+        width = width or size.columns
+
     msg = bg_colors["red"] + msg.ljust(width - 10, " ") + bg_colors["reset"]
     invisible_msg = " " * len(msg)  #: Blank msg replacing the error for disappearing.
 
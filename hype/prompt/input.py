@@ -27,6 +27,8 @@ from hype.prompt.error import error
 from hype.constants import rule_colors
 from hype.constants import COLOR_SUPPORTED
 
+from hype.text import visible_width
+
 from hype.cursor import hide as _hide_cursor
 from hype.cursor import show as _show_cursor
 from typing import Callable, Optional
@@ -177,7 +179,7 @@ class Input:
             elif key == keys.BACKSPACE:
                 self.text = self.text[:-1]
                 self.stream.write(
-                    f'\r{(len(self.prompt)+len(self.text)+1)*" "}\r{self.prompt}{self.text[:len(self.text)]}'
+                    f'\r{(visible_width(self.prompt)+visible_width(self.text)+1)*" "}\r{self.prompt}{self.text[:len(self.text)]}'
                 )
                 self.stream.flush()
 
@@ -26,6 +26,8 @@ from hype.prompt.getkey import keys
 from hype.constants import rule_colors
 from hype.constants import COLOR_SUPPORTED
 
+from hype.text import visible_width
+
 from hype.cursor import hide as _hide_cursor
 from hype.cursor import show as _show_cursor
 from typing import Optional
@@ -140,7 +142,7 @@ class Password:
             elif key == keys.BACKSPACE:
                 self.__buffer = self.__buffer[:-1]
                 self.stream.write(
-                    f'\r{(len(self.prompt)+len(self.__buffer)+1)*" "}\r{self.prompt}{"*" * len(self.__buffer)}'
+                    f'\r{(visible_width(self.prompt)+len(self.__buffer)+1)*" "}\r{self.prompt}{"*" * len(self.__buffer)}'
                 )
                 self.stream.flush()
 
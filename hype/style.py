@@ -103,6 +103,8 @@ class AnsiStyle(AnsiCodes):
     ITALIC = 3
     UNDERLINE = 4
     NORMAL = 22
+    NOT_ITALIC = 23
+    NOT_UNDERLINE = 24
     RESET_ALL = 0
 
 
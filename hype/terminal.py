@@ -0,0 +1,195 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+#: The capabilities of the terminal. They are detected on first use and
+#: cached, nothing is done when hype is imported. The stream wrappers of
+#: colorama are only installed on a Windows console without support of
+#: the escape codes, the first time color is written to it.
+
+from typing import IO
+from typing import Optional
+import os
+import sys
+
+#: The color depths
+NO_COLOR = 0
+BASIC_COLOR = 16
+EXTENDED_COLOR = 256
+TRUE_COLOR = 1 << 24
+
+
+class Terminal:
+    """
+    The capabilities of the terminal of a stream, detected on first use.
+
+    Parameters:
+    ---
+        stream (IO[str]):
+            The output stream.
+
+    Example:
+    ---
+
+        >>> terminal = get_terminal()
+        >>> if terminal.color_depth >= EXTENDED_COLOR:
+        >>>     ...
+
+    """
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+
+        self.__isatty = None
+        self.__color_depth = None
+        self.__vt = None
+        self.__ansi_enabled = False
+
+    @property
+    def isatty(self) -> bool:
+        """
+        True if the stream is a terminal.
+        """
+        if self.__isatty is None:
+            isatty = getattr(self.stream, "isatty", None)
+
+            try:
+                self.__isatty = bool(isatty and isatty())
+
+            except ValueError:
+                #: The stream is closed
+                self.__isatty = False
+
+        return self.__isatty
+
+    @property
+    def vt(self) -> bool:
+        """
+        True if the terminal handles the escape codes. On Windows the virtual
+        terminal processing of the console is enabled if possible.
+        """
+        if self.__vt is None:
+            self.__vt = self.isatty and (os.name != "nt" or enable_vt_mode(self.stream))
+
+        return self.__vt
+
+    @property
+    def color_depth(self) -> int:
+        """
+        The number of colors of the terminal: `NO_COLOR` when the stream is not
+        a terminal or the `NO_COLOR` environment variable is set, `BASIC_COLOR`,
+        `EXTENDED_COLOR` or `TRUE_COLOR` from the `COLORTERM` and `TERM`
+        environment variables.
+        """
+        if self.__color_depth is None:
+            term = os.environ.get("TERM", "")
+            colorterm = os.environ.get("COLORTERM", "")
+
+            if os.environ.get("NO_COLOR") or not self.isatty or term == "dumb":
+                self.__color_depth = NO_COLOR
+
+            elif colorterm in ("truecolor", "24bit") or (os.name == "nt" and self.vt):
+                self.__color_depth = TRUE_COLOR
+
+            elif "256" in term:
+                self.__color_depth = EXTENDED_COLOR
+
+            else:
+                self.__color_depth = BASIC_COLOR
+
+        return self.__color_depth
+
+    @property
+    def width(self) -> int:
+        """
+        The number of columns of the terminal. It is not cached since
+        the terminal can be resized.
+        """
+        import shutil
+
+        return shutil.get_terminal_size().columns
+
+    def enable_ansi(self) -> bool:
+        """
+        Make sure the escape codes written to the stream are handled. On a
+        Windows console without virtual terminal processing, the streams are
+        wrapped by colorama (once). Return False if it is not possible.
+        """
+        if self.__ansi_enabled or self.vt or not self.isatty:
+            return True
+
+        try:
+            import colorama
+
+        except ModuleNotFoundError:
+            return False
+
+        colorama.init()
+        self.__ansi_enabled = True
+
+        return True
+
+    def refresh(self):
+        """
+        Detect the capabilities again on next use.
+        """
+        self.__init__(self.stream)
+
+
+def enable_vt_mode(stream: IO[str]) -> bool:
+    """
+    Enable the virtual terminal processing of a Windows console.
+    Return False if it is not supported.
+    """
+    try:
+        import ctypes
+        import msvcrt
+
+        kernel32 = ctypes.windll.kernel32
+        handle = msvcrt.get_osfhandle(stream.fileno())
+        mode = ctypes.c_ulong()
+
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+
+        #: ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+
+    except (ImportError, AttributeError, OSError, ValueError):
+        return False
+
+
+_terminals = {}
+
+
+def get_terminal(stream: Optional[IO[str]] = None) -> Terminal:
+    """
+    Return the capabilities of the terminal of the stream, `sys.stdout` by
+    default. They are cached for the standard streams only.
+    """
+    stream = stream or sys.stdout
+
+    if stream is sys.__stdout__ or stream is sys.__stderr__:
+        if id(stream) not in _terminals:
+            _terminals[id(stream)] = Terminal(stream)
+
+        return _terminals[id(stream)]
+
+    return Terminal(stream)
@@ -0,0 +1,184 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+#: Measurement of the text displayed in the terminal. The escape codes take
+#: no column and the east asian wide characters take two. The width of each
+#: character is computed once and kept in a table.
+
+import re
+import unicodedata
+
+__all__ = ["visible_width", "truncate_visible", "strip_ansi", "wcswidth"]
+
+#: The escape sequences: CSI (colors, cursor), OSC (title, links) and the
+#: two characters ones.
+ANSI_PATTERN = re.compile(
+    r"\x1b\[[0-9;:?<=>]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-Z\\-_]"
+)
+
+
+class WidthTable(dict):
+    """
+    The number of columns of each character, computed on first lookup.
+    """
+
+    def __missing__(self, char: str) -> int:
+        width = get_char_width(char)
+        self[char] = width
+
+        return width
+
+
+def get_char_width(char: str) -> int:
+    """
+    Return the number of columns of a character: 0 for the control, combining
+    and zero width characters, 2 for the east asian wide ones and 1 otherwise.
+    """
+    code = ord(char)
+
+    if code < 32 or 0x7F <= code < 0xA0:
+        return 0
+
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+
+    return 1
+
+
+WIDTHS = WidthTable()
+
+
+def strip_ansi(text: str) -> str:
+    """
+    Remove the escape sequences of the text.
+    """
+    if "\x1b" not in text:
+        return text
+
+    return ANSI_PATTERN.sub("", text)
+
+
+def visible_width(text: str, markup: bool = False) -> int:
+    """
+    Return the number of columns the text takes in the terminal.
+
+    Parameters:
+    ---
+        text (str):
+            The text, it can contain escape sequences.
+
+        markup (bool):
+            Set if the text has color tags (see `hype.color`), they take no column.
+
+    Example:
+    ---
+
+        >>> visible_width('\\x1b[31m日本\\x1b[39m')
+        4
+        >>> visible_width('[red]ok[/red]', markup=True)
+        2
+    """
+    if markup:
+        from .color import render_plain
+
+        text = render_plain(text)
+
+    text = strip_ansi(text)
+
+    if text.isascii():
+        #: Only the control characters take no column.
+        if text.isprintable():
+            return len(text)
+
+    return sum(map(WIDTHS.__getitem__, text))
+
+
+def wcswidth(text: str) -> int:
+    """
+    Same as `visible_width`, with the name of `wcwidth.wcswidth`.
+    """
+    return visible_width(text)
+
+
+def truncate_visible(text: str, width: int, ellipsis: str = "") -> str:
+    """
+    Cut the text to the number of columns, without cutting the escape sequences.
+    The escape sequences after the cut are kept, so the styles opened before it
+    are still closed.
+
+    Parameters:
+    ---
+        text (str):
+            The text, it can contain escape sequences.
+
+        width (int):
+            The number of columns.
+
+        ellipsis (str):
+            Added at the end when the text is cut, it is part of the width.
+
+    Example:
+    ---
+
+        >>> truncate_visible('\\x1b[31mhello\\x1b[39m', 3)
+        '\\x1b[31mhel\\x1b[39m'
+    """
+    if "\x1b" not in text and text.isascii() and text.isprintable():
+        if len(text) <= width:
+            return text
+
+        return text[: max(0, width - len(ellipsis))] + ellipsis if width > 0 else ""
+
+    if visible_width(text) <= width:
+        return text
+
+    width -= visible_width(ellipsis)
+    result = []
+    used = 0
+    pos = 0
+    cut = False
+
+    for match in ANSI_PATTERN.finditer(text + "\x1b[m"):
+        start, end = match.span()
+
+        for char in text[pos:start]:
+            if cut:
+                break
+
+            char_width = WIDTHS[char]
+
+            if used + char_width > width:
+                result.append(ellipsis)
+                cut = True
+                break
+
+            used += char_width
+            result.append(char)
+
+        if end <= len(text):
+            result.append(match.group())
+
+        pos = end
+
+    return "".join(result)
@@ -20,8 +20,18 @@
 
 #: Spinner frames are https://github.com/sindresorhus
 
-from .spinner import Spinner
-from .table import Table
-from .progress import progressbar
+from hype.lazy import lazy_attributes
 
-__all__ = ["Spinner", "Table", "progressbar"]
+#: The names are imported on first access.
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Live": ".live",
+        "SharedCounter": ".counter",
+        "Spinner": ".spinner",
+        "Table": ".table",
+        "progressbar": ".progress",
+    },
+)
+
+__all__ = ["Live", "SharedCounter", "Spinner", "Table", "progressbar"]
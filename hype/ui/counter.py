@@ -0,0 +1,157 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+#: A counter shared by the processes of a `multiprocessing` pool. Each
+#: thread of each process increments its own slot of a shared memory
+#: array, so counting needs neither a lock nor a message to the parent,
+#: which only sums the slots when it renders.
+
+from typing import Any
+from typing import Optional
+import multiprocessing
+import os
+import threading
+
+#: The counter installed in the current process, see `SharedCounter.install`.
+_installed = None
+
+
+class SharedCounter:
+    """
+    A counter incremented by many processes. A thread claims a slot of
+    the counter the first time it counts, the threads without a free
+    slot share a last slot protected by a lock.
+
+    The counter is passed to the worker processes when they are created,
+    like the other `multiprocessing` shared objects, e.g. with the
+    initializer of the pool.
+
+    Parameters:
+    ---
+        slots (int):
+            The number of threads (of all the processes) counting without
+            a lock. Defaults to the number of CPUs, plus one for the parent.
+
+        context (multiprocessing.context.BaseContext):
+            The context of the worker processes, when it is not the default one.
+
+    Example:
+    ---
+        >>> from concurrent.futures import ProcessPoolExecutor
+        >>> from hype.ui import SharedCounter, progressbar
+        >>> from hype.ui.counter import get_counter
+        >>>
+        >>> def work(chunk):
+        >>>     for item in chunk:
+        >>>         ...
+        >>>         get_counter().add()
+        >>>
+        >>> counter = SharedCounter()
+        >>> with progressbar(total, counter=counter):
+        >>>     with ProcessPoolExecutor(initializer=counter.install) as pool:
+        >>>         list(pool.map(work, chunks))
+    """
+
+    def __init__(self, slots: Optional[int] = None, context: Optional[Any] = None):
+        if slots is None:
+            slots = (os.cpu_count() or 1) + 1
+
+        if slots < 1:
+            raise ValueError("slots must be positive, got %r" % (slots))
+
+        context = context or multiprocessing.get_context()
+
+        #: The last slot is shared by the processes without their own slot.
+        self.__counts = context.RawArray("q", slots + 1)
+        self.__claimed = context.RawValue("i", 0)
+        self.__lock = context.Lock()
+
+        #: (process id, thread id) -> slot, -1 for the shared slot.
+        #: The process id is part of the key since a forked process
+        #: inherits the slots of its parent.
+        self.__slots = {}
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+
+        #: The slots are claimed again by the threads of the new process.
+        state["_SharedCounter__slots"] = {}
+
+        return state
+
+    def __claim(self, key: tuple) -> int:
+        with self.__lock:
+            slot = self.__claimed.value
+
+            if slot < len(self.__counts) - 1:
+                self.__claimed.value += 1
+            else:
+                slot = -1
+
+        self.__slots[key] = slot
+
+        return slot
+
+    def add(self, n: int = 1):
+        """
+        Add n to the counter.
+        """
+        key = (os.getpid(), threading.get_ident())
+        slot = self.__slots.get(key)
+
+        if slot is None:
+            slot = self.__claim(key)
+
+        if slot != -1:
+            self.__counts[slot] += n
+            return
+
+        with self.__lock:
+            self.__counts[-1] += n
+
+    @property
+    def value(self) -> int:
+        """
+        The sum of the counts of all the processes.
+        """
+        return sum(self.__counts)
+
+    def install(self):
+        """
+        Make the counter the one returned by `get_counter` in the current
+        process. Meant to be the initializer of the worker processes.
+        """
+        global _installed
+
+        _installed = self
+
+
+def get_counter() -> SharedCounter:
+    """
+    Return the counter installed in the current process.
+    """
+    if _installed is None:
+        raise RuntimeError(
+            "No counter is installed, pass `counter.install` as the "
+            "initializer of the pool."
+        )
+
+    return _installed
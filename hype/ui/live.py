@@ -0,0 +1,292 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+#: A live region of the terminal. It owns a block of lines, each worker
+#: (spinner, progress bar, or anything else) updates its own line and the
+#: block is redrawn by the render scheduler at a single frame rate,
+#: rewriting only the lines that changed since the previous frame.
+
+from typing import IO
+from typing import List
+from typing import Optional
+import sys
+import threading
+
+from hype.cursor import hide as hide_cursor
+from hype.cursor import show as show_cursor
+from hype.style import Cursor
+from hype.style import clear_line
+from hype.terminal import get_terminal
+from hype.text import truncate_visible
+from .scheduler import animate
+from .scheduler import cancel
+from .scheduler import scheduler
+
+#: Clear from the cursor to the end of the line.
+CLEAR_LINE = clear_line(0)
+
+
+def move_cursor(row: int, to: int) -> str:
+    """
+    Return the escape code moving the cursor from a row of the region to another.
+    """
+    if to < row:
+        return Cursor.UP(row - to)
+
+    if to > row:
+        return Cursor.DOWN(to - row)
+
+    return ""
+
+
+class Live:
+    """
+    A block of lines redrawn in place. The lines are updated from any
+    thread and the changed ones are written at most `fps` times per second,
+    by the single render thread of `hype.ui.scheduler`. When the stream is
+    not a terminal, only the printed text and the final lines are written.
+
+    Parameters:
+    ---
+        stream (IO):
+            The stream the region is written to (defaults to sys.stdout)
+
+        fps (float):
+            The maximum number of frames per second.
+
+        cursor (bool):
+            Set if the cursor is shown while the region is live.
+
+    Example:
+    ---
+        >>> from hype.ui import Live, Spinner
+        >>> with Live() as live:
+        >>>     line = live.add('Downloading')
+        >>>     live.update(line, 'Downloading 42%')
+        >>>     live.print('a.txt downloaded')
+        >>>     with Spinner('Extracting', live=live):
+        >>>         ...
+
+        With `async with`, the region is drawn by a task of the event loop.
+    """
+
+    def __init__(
+        self, stream: Optional[IO[str]] = None, fps: float = 20.0, cursor: bool = False
+    ):
+        if fps <= 0:
+            raise ValueError("fps must be positive, got %r" % (fps))
+
+        self.stream = stream or sys.stdout
+        self.interval = 1.0 / fps
+        self.cursor = cursor
+
+        self.__lock = threading.Lock()
+        self.__lines: List[str] = []
+        self.__drawn: List[str] = []
+        self.__printed: List[str] = []
+        self.__changed = False
+        self.__started = False
+        self.__animated = False
+        self.__task = None
+
+    def __len__(self) -> int:
+        return len(self.__lines)
+
+    def __getitem__(self, index: int) -> str:
+        return self.__lines[index]
+
+    def __setitem__(self, index: int, text: str):
+        self.update(index, text)
+
+    def add(self, text: str = "") -> int:
+        """
+        Add a line at the bottom of the region and return its index.
+        """
+        with self.__lock:
+            self.__lines.append(text)
+            self.__changed = True
+
+            return len(self.__lines) - 1
+
+    def update(self, index: int, text: str):
+        """
+        Set the text of a line. It is written on the next frame.
+        """
+        with self.__lock:
+            if self.__lines[index] is not None and self.__lines[index] != text:
+                self.__lines[index] = text
+                self.__changed = True
+
+    def remove(self, index: int):
+        """
+        Remove a line from the region on the next frame. The indexes of
+        the other lines do not change.
+        """
+        with self.__lock:
+            if self.__lines[index] is not None:
+                self.__lines[index] = None
+                self.__changed = True
+
+    def print(self, text: str):
+        """
+        Print the text above the region, on the next frame.
+        """
+        with self.__lock:
+            if self.__started and not self.__animated:
+                self.stream.write("%s\n" % (text))
+                self.stream.flush()
+                return
+
+            self.__printed.append(text)
+            self.__changed = True
+
+    def frame(self) -> str:
+        """
+        Return the escape codes and text redrawing the changed lines.
+        The cursor is left at the start of the line below the region.
+        Called by the render scheduler.
+        """
+        with self.__lock:
+            if not self.__changed:
+                return ""
+
+            lines, drawn, printed = self.__visible(), self.__drawn, self.__printed
+            self.__printed, self.__changed = [], False
+
+        width = get_terminal(self.stream).width
+        lines = [truncate_visible(line, width) for line in lines]
+        output = []
+        row = len(drawn)
+
+        #: The rows of the last frame, below the start of the region
+        stale = len(drawn)
+
+        if printed:
+            #: Print over the region and draw it again below the text.
+            output.append(move_cursor(row, 0))
+            output.extend("\r%s%s\n" % (text, CLEAR_LINE) for text in printed)
+            row, drawn, stale = 0, [], stale - len(printed)
+
+        for index, line in enumerate(lines[: len(drawn)]):
+            if drawn[index] != line:
+                output.append(move_cursor(row, index))
+                output.append("\r%s%s" % (line, CLEAR_LINE))
+                row = index
+
+        output.append(move_cursor(row, min(len(lines), len(drawn))))
+        output.append("\r")
+        output.extend("%s%s\n" % (line, CLEAR_LINE) for line in lines[len(drawn) :])
+
+        if stale > len(lines):
+            #: Lines were removed, clear the rows left below the region.
+            output.extend(
+                "%s%s" % (CLEAR_LINE, Cursor.DOWN(1))
+                for _ in range(stale - len(lines))
+            )
+            output.append(Cursor.UP(stale - len(lines)))
+
+        self.__drawn = lines
+
+        return "".join(output)
+
+    def __visible(self) -> List[str]:
+        """
+        Return the lines that were not removed.
+        """
+        return [line for line in self.__lines if line is not None]
+
+    def __begin(self) -> bool:
+        """
+        Start the region, return True if it has to be animated.
+        """
+        if self.__started:
+            return False
+
+        terminal = get_terminal(self.stream)
+        self.__started = True
+        self.__animated = terminal.isatty and terminal.enable_ansi()
+
+        if self.__animated and not self.cursor:
+            hide_cursor(self.stream)
+
+        return self.__animated
+
+    def start(self):
+        """
+        Start drawing the region.
+        """
+        if self.__begin():
+            scheduler.add(self)
+
+        return self
+
+    def stop(self):
+        """
+        Stop drawing the region and write its final lines.
+        """
+        if not self.__started:
+            return self
+
+        self.__started = False
+
+        if self.__animated:
+            scheduler.remove(self)
+            self.stream.write(self.frame())
+
+            if not self.cursor:
+                show_cursor(self.stream)
+
+        else:
+            with self.__lock:
+                printed, self.__printed = self.__printed, []
+
+            self.stream.write("".join("%s\n" % (text) for text in printed))
+            self.stream.write("".join("%s\n" % (line) for line in self.__visible()))
+
+        self.stream.flush()
+
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+    async def __aenter__(self):
+        """
+        Draw the region from a task of the running event loop.
+        """
+        import asyncio
+
+        if self.__begin():
+            self.__task = asyncio.ensure_future(animate(self))
+
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        task, self.__task = self.__task, None
+
+        try:
+            if task is not None:
+                await cancel(task)
+        finally:
+            self.stop()
@@ -50,23 +50,61 @@ try:
 except ModuleNotFoundError:
     pass
 
+from hype.text import truncate_visible
+from hype.text import visible_width
 from hype.cursor import hide as hide_cursor
 from hype.cursor import show as show_cursor
 from hype.constants import rule_colors
 from hype.constants import COLOR_SUPPORTED
 from hype.errors import PluginError
+from .scheduler import Animation
+from .scheduler import animate
+from .scheduler import scheduler
 
 
-@contextmanager
-def progressbar(
-    total=None, title=None, calibrate=None, bar_color=None, title_color=None, **options
-):
+class ProgressBar:
+    """
+    The context manager returned by `progressbar`, for both the `with`
+    and `async with` statements.
+    """
+
+    def __init__(self, args: tuple, kwargs: dict):
+        self.args = args
+        self.kwargs = kwargs
+        self.__context = None
+
+    def __enter__(self):
+        self.__context = _progressbar(*self.args, **self.kwargs)
+        return self.__context.__enter__()
+
+    def __exit__(self, type, value, traceback):
+        return self.__context.__exit__(type, value, traceback)
+
+    async def __aenter__(self):
+        self.__context = _progressbar(*self.args, asynchronous=True, **self.kwargs)
+        self.__handle = self.__context.__enter__()
+        return self.__handle
+
+    async def __aexit__(self, type, value, traceback):
+        #: The render task is cancelled when the bar ends.
+        task = getattr(self.__handle, "task", None)
+
+        try:
+            return self.__context.__exit__(type, value, traceback)
+        finally:
+            if task is not None:
+                import asyncio
+
+                await asyncio.wait([task])
+
+
+def progressbar(*args, **kwargs) -> ProgressBar:
     """
     Hype Progressbar inherited from `alive_bar` and add some Features.
 
     Parameters:
     ---
-        Similar to `alive_bar` but then added 2 options:
+        Similar to `alive_bar` but then added 3 options:
 
         - `bar_color (str)`:
             Set the color of the bar.
@@ -74,6 +112,25 @@ def progressbar(
         - `title_color (str)`:
             Set the title color.
 
+        - `live (Live)`:
+            Draw the bar on its own line of a `hype.ui.Live` region, at the
+            frame rate of the region. `print()` is not hooked, use `live.print`.
+
+        - `counter (SharedCounter)`:
+            Also count the items counted by other processes with a
+            `hype.ui.SharedCounter`. It is read when the bar is rendered.
+
+        - `fast (bool)`:
+            Make `bar()` a single increment of the count, for very high item
+            rates. It takes no argument, `bar.advance_many(n)` counts n items
+            at once. The percentage, rate and eta are only computed when the
+            bar is rendered, and a `print()` without a newline is shown with
+            the next line printed. Not available in manual mode.
+
+        With `async with progressbar(...) as bar`, the bar is rendered by a
+        task of the running event loop, without any thread, and
+        `await bar.advance(n)` moves it forward and lets the bar render.
+
 
     An alive progress bar to keep track of lengthy operations.
     It has a spinner indicator, elapsed time, throughput and ETA.
@@ -148,6 +205,27 @@ def progressbar(
             title_length (int): fixed title length, or 0 for unlimited
     """
 
+    return ProgressBar(args, kwargs)
+
+
+@contextmanager
+def _progressbar(
+    total=None,
+    title=None,
+    calibrate=None,
+    bar_color=None,
+    title_color=None,
+    live=None,
+    counter=None,
+    fast=False,
+    asynchronous=False,
+    **options
+):
+    """
+    The progress bar of `progressbar`. With `asynchronous`, it is
+    rendered by a task of the running event loop instead of a thread.
+    """
+
     if bar_color or title_color and not COLOR_SUPPORTED:
         raise PluginError(
             "You need color plugin inorder to style the bar. Read the docs for more info"
@@ -181,6 +259,18 @@ def progressbar(
         """
         )
 
+    if counter is not None and config.manual:
+        raise ValueError("A counter cannot be used in manual mode.")
+
+    if fast and config.manual:
+        raise ValueError("The fast mode cannot be used in manual mode.")
+
+    #: The items counted by bar() in the fast mode.
+    ticks = 0
+
+    def count():
+        return run.count + run.shared + ticks
+
     def run(spinner):
         player = spinner_player(spinner)
         while thread:
@@ -188,8 +278,22 @@ def progressbar(
             alive_repr(next(player))
             time.sleep(1.0 / fps())
 
+    async def run_async(spinner):
+        import asyncio
+
+        player = spinner_player(spinner)
+        while True:
+            if release_thread.is_set():
+                alive_repr(next(player))
+            await asyncio.sleep(1.0 / fps())
+
     def alive_repr(spin=""):
 
+        if counter is not None:
+            run.shared = counter.value
+        if fast or counter is not None:
+            update_hook()  # not called by bar().
+
         elapsed = time.time() - run.init
         run.rate = current() / elapsed if elapsed else 0.0
 
@@ -229,12 +333,16 @@ def progressbar(
                 )
             )
 
-        line_len, (cols, _) = len(line), get_terminal_size()
+        if live is not None:
+            live.update(run.line, line)
+            return
+
+        line_len, (cols, _) = visible_width(line), get_terminal_size()
         with print_lock:
             if line_len < run.last_line_len:
                 clear_traces()
 
-            sys.__stdout__.write(line[:cols] + (spin and "\r" or "\n"))
+            sys.__stdout__.write(truncate_visible(line, cols) + (spin and "\r" or "\n"))
             sys.__stdout__.flush()
 
         run.last_line_len = line_len
@@ -274,6 +382,22 @@ def progressbar(
                 )
                 set_text(text)
 
+    elif fast:
+
+        def bar_handle():
+            """Bar handle for the fast mode. Only counts one item, the
+            percentage is updated when the bar is rendered.
+            """
+            nonlocal ticks
+            ticks += 1
+
+        def advance_many(n):
+            """Counts n items at once in the fast mode."""
+            nonlocal ticks
+            ticks += n
+
+        bar_handle.advance_many = advance_many
+
     else:
 
         def bar_handle(text=None, incr=1):
@@ -294,6 +418,8 @@ def progressbar(
                 )
                 set_text(text)
 
+        bar_handle.advance_many = lambda n: bar_handle(incr=n)  # noqa
+
     def print_hook(part):
         if part != "\n":
             # this will generate a sequence of lines interspersed with None, which will later
@@ -301,7 +427,7 @@ def progressbar(
             gen = chain.from_iterable(zip(repeat(None), part.splitlines(True)))
             print_buffer.extend(islice(gen, 1, None))
         else:
-            header = header_template.format(run.count)
+            header = header_template.format(count())
             nested = "".join(line or " " * len(header) for line in print_buffer)
             with print_lock:
                 clear_traces()
@@ -315,6 +441,10 @@ def progressbar(
     print_hook.isatty = sys.__stdout__.isatty
 
     def start_monitoring(offset=0.0):
+        if live is not None:
+            run.init = time.time() - offset
+            return
+
         hide_cursor()
         sys.stdout = print_hook
         run.before_handlers = install_logging_hook()
@@ -322,13 +452,26 @@ def progressbar(
         run.init = time.time() - offset
 
     def stop_monitoring():
+        if live is not None:
+            return time.time() - run.init
+
         show_cursor()
         sys.stdout = sys.__stdout__
         uninstall_logging_hook(run.before_handlers)  # noqa
         return time.time() - run.init
 
     thread, release_thread = None, threading.Event()
-    if sys.stdout.isatty() or config.force_tty:
+    animation, render_async = None, None
+    if live is not None:
+        #: Rendered by the scheduler thread, like the other lines of the region.
+        run.line = live.add()
+        player = spinner_player(config.spinner())
+        animation = Animation(lambda: alive_repr(next(player)), live.interval)
+
+        if asynchronous:
+            render_async = lambda: animate(animation)  # noqa
+
+    elif sys.stdout.isatty() or config.force_tty:
 
         @contextmanager
         def pause_monitoring():
@@ -339,16 +482,21 @@ def progressbar(
             start_monitoring(offset)
 
         bar_handle.pause = pause_monitoring
-        thread = threading.Thread(target=run, args=(config.spinner(),))
-        thread.daemon = True
-        thread.start()
+
+        if asynchronous:
+            spinner = config.spinner()
+            render_async = lambda: run_async(spinner)  # noqa
+        else:
+            thread = threading.Thread(target=run, args=(config.spinner(),))
+            thread.daemon = True
+            thread.start()
 
     if total or not config.manual:  # we can count items.
         logic_total, rate_spec, factor, current = (
             total,
             "f",
             1.0e6,
-            lambda: run.count,
+            count,
         )  # noqa
     else:  # there's only a manual percentage.
         logic_total, rate_spec, factor, current = (
@@ -358,7 +506,20 @@ def progressbar(
             lambda: run.percent,
         )  # noqa
 
+    async def advance(n=1):
+        """Same as `bar(incr=n)` (`bar(n)` in manual mode), then lets the
+        event loop run the other tasks, like the one rendering the bar.
+        """
+        import asyncio
+
+        if config.manual:
+            bar_handle(n)
+        else:
+            bar_handle.advance_many(n)
+        await asyncio.sleep(0)
+
     bar_handle.text, bar_handle.current = set_text, current
+    bar_handle.advance = advance
     if total or config.manual:  # we can track progress and therefore eta.
         spec = "({{:.1{}}}/s, eta: {{}})".format(rate_spec)
         gen_eta = gen_simple_exponential_smoothing_eta(0.5, logic_total)
@@ -396,6 +557,8 @@ def progressbar(
 
     end, run.text, run.last_line_len = False, "", 0
     run.count, run.percent, run.rate, run.init = 0, 0.0, 0.0, 0.0
+    #: The count of the other processes, see `SharedCounter`.
+    run.shared = 0
 
     if total:
         if config.manual:
@@ -406,10 +569,10 @@ def progressbar(
         else:
 
             def update_hook():
-                run.percent = run.count / total
+                run.percent = count() / total
 
         monitor = lambda: "{}{}/{} [{:.0%}]".format(  # noqa
-            "(!) " if end and run.count != total else "", run.count, total, run.percent
+            "(!) " if end and count() != total else "", count(), total, run.percent
         )
     elif config.manual:
         update_hook = lambda: None  # noqa
@@ -419,18 +582,29 @@ def progressbar(
     else:
         run.percent = 1.0
         update_hook = lambda: None  # noqa
-        monitor = lambda: "{}".format(run.count)  # noqa
+        monitor = lambda: "{}".format(count())  # noqa
 
     title = render_title(title, config.title_length)
     start_monitoring()
+    if render_async:
+        import asyncio
+
+        bar_handle.task = asyncio.ensure_future(render_async())
+    elif animation:
+        scheduler.add(animation)
     try:
         yield bar_handle
     finally:
         flush_buffer()
         stop_monitoring()
+        if render_async:
+            bar_handle.task.cancel()
+        elif animation:
+            scheduler.remove(animation)
         if thread:
             local_copy = thread
             thread = None  # lets the internal thread terminate gracefully.
+            release_thread.set()  # even when it is paused.
             local_copy.join()
 
         end, run.text, stats = True, "", stats_end
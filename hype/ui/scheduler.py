@@ -0,0 +1,256 @@
+#                   Copyright (c) 2021, Serum Studio
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+#: The render scheduler of the animations. A single thread ticks every
+#: active animation of the process at its own interval and writes the
+#: frames that are due in the same tick with one write per stream.
+#: In asyncio programs, `animate` renders an animation from a task of the
+#: event loop instead.
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+import atexit
+import threading
+import time
+
+
+class RenderScheduler:
+    """
+    Render the animations from a single thread. An animation has an
+    `interval` (in seconds), a `stream` and a `frame()` method returning
+    the text of its next frame (nothing is written for an empty frame).
+    The thread is started with the first animation and ends when the
+    last one is removed. An animation whose frame raises is removed.
+
+    Example:
+    ---
+        >>> from hype.ui.scheduler import scheduler
+        >>> scheduler.add(spinner)
+        >>> ...
+        >>> scheduler.remove(spinner)
+    """
+
+    def __init__(self):
+        self.__condition = threading.Condition()
+        self.__jobs: Dict[Any, float] = {}
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def thread(self) -> Optional[threading.Thread]:
+        """
+        The render thread, None when no animation is active.
+        """
+        return self.__thread
+
+    def add(self, job: Any):
+        """
+        Start rendering the animation. Its first frame is rendered right away.
+        """
+        with self.__condition:
+            self.__jobs[job] = time.monotonic()
+
+            if self.__thread is None:
+                self.__thread = threading.Thread(
+                    target=self.__run, name="hype-render", daemon=True
+                )
+                self.__thread.start()
+
+            self.__condition.notify_all()
+
+    def remove(self, job: Any):
+        """
+        Stop rendering the animation. Once it returns, no frame of the
+        animation is written anymore, and the thread has ended if it was
+        the last animation.
+        """
+        with self.__condition:
+            self.__jobs.pop(job, None)
+            self.__condition.notify_all()
+            self.__wait()
+
+    def stop(self):
+        """
+        Stop rendering every animation and wait for the thread to end.
+        """
+        with self.__condition:
+            self.__jobs.clear()
+            self.__condition.notify_all()
+            self.__wait()
+
+    def __wait(self):
+        """
+        Wait for the thread to end when no animation is left.
+        Called with the lock held.
+        """
+        thread = self.__thread
+
+        if thread is threading.current_thread():
+            return
+
+        while thread is not None and self.__thread is thread and not self.__jobs:
+            self.__condition.wait()
+
+    def __next(self) -> Optional[list]:
+        """
+        Wait for the animations that are due, None when there are none left.
+        Called with the lock held.
+        """
+        while True:
+            if not self.__jobs:
+                self.__thread = None
+                self.__condition.notify_all()
+                return None
+
+            now = time.monotonic()
+            due = [job for job, at in self.__jobs.items() if at <= now]
+
+            if due:
+                break
+
+            self.__condition.wait(min(self.__jobs.values()) - now)
+
+        for job in due:
+            #: Skip the frames that were missed instead of catching up.
+            self.__jobs[job] = max(self.__jobs[job] + job.interval, now)
+
+        return due
+
+    def __run(self):
+        try:
+            while True:
+                with self.__condition:
+                    due = self.__next()
+
+                    if due is None:
+                        return
+
+                    self.__render(due)
+
+        finally:
+            #: Never leave `remove` waiting for a thread that has ended.
+            with self.__condition:
+                if self.__thread is threading.current_thread():
+                    self.__thread = None
+
+                self.__condition.notify_all()
+
+    def __render(self, due: list):
+        """
+        Write the frames of the animations that are due. Called with the
+        lock held, so `remove` waits for the frame being written.
+        """
+        streams = {}
+
+        for job in due:
+            try:
+                frame = job.frame()
+
+            except Exception:
+                #: A broken animation must not stop the other ones.
+                del self.__jobs[job]
+                continue
+
+            streams.setdefault(id(job.stream), (job.stream, []))[1].append(frame)
+
+        for stream, frames in streams.values():
+            output = "".join(frames)
+
+            #: Nothing to write, e.g. the animations drawn by a `Live` region.
+            if not output:
+                continue
+
+            try:
+                stream.write(output)
+                stream.flush()
+
+            except (OSError, ValueError):
+                #: The stream was closed.
+                for job in list(self.__jobs):
+                    if job.stream is stream:
+                        del self.__jobs[job]
+
+
+class Animation:
+    """
+    An animation calling `render` every `interval` seconds and writing
+    nothing itself, e.g. to update a line of a `hype.ui.Live` region.
+
+    Parameters:
+    ---
+        render (Callable):
+            Called on every frame.
+
+        interval (float):
+            The interval between two frames, in seconds.
+    """
+
+    stream = None
+
+    def __init__(self, render: Callable[[], Any], interval: float):
+        self.render = render
+        self.interval = interval
+
+    def frame(self) -> str:
+        self.render()
+        return ""
+
+
+async def animate(job: Any):
+    """
+    Render the animation from the running event loop, like the render
+    thread does, until the task is cancelled.
+
+    Example:
+    ---
+        >>> task = asyncio.ensure_future(animate(spinner))
+        >>> ...
+        >>> await cancel(task)
+    """
+    #: asyncio is only imported by the programs using it.
+    import asyncio
+
+    while True:
+        output = job.frame()
+
+        if output:
+            job.stream.write(output)
+            job.stream.flush()
+
+        await asyncio.sleep(job.interval)
+
+
+async def cancel(task: Any):
+    """
+    Cancel the task and wait for it to end. The cancellation of the
+    current task is not swallowed.
+    """
+    import asyncio
+
+    task.cancel()
+    await asyncio.wait([task])
+
+
+#: The render scheduler of the process.
+scheduler = RenderScheduler()
+
+atexit.register(scheduler.stop)
@@ -23,13 +23,14 @@
 
 import itertools
 import sys
-import time
 from typing import Optional
 from typing import Any
 from .constants import SpinnerType
+from .scheduler import animate
+from .scheduler import cancel
+from .scheduler import scheduler
 from hype.cursor import hide as hide_cursor
 from hype.cursor import show as show_cursor
-import threading
 from hype.constants import COLOR_SUPPORTED
 from hype.constants import rule_colors
 
@@ -58,6 +59,10 @@ class Spinner:
         cursor (bool):
             Set if the cursor is hidden or shown
 
+        live (Live):
+            Draw the spinner on its own line of a `hype.ui.Live` region
+            instead of the current line of the stream.
+
 
     Example:
     ---
@@ -66,17 +71,19 @@ class Spinner:
         >>> with Spinner('Loading', type='arc') as spinner:
         >>>     spinner.start() # Start the spinner
 
+        In asyncio programs, the spinner is rendered by a task of the event loop:
 
-    """
+        >>> async with Spinner('Loading'):
+        >>>     await download()
 
-    #: Set the stop event to None
-    __stop_event = None
 
-    #: Set the stop event to None
-    __thread = None
+    """
+
+    #: The frames of the spinner, set when it is started.
+    __frames = None
 
-    #: Set the stop event to None
-    __thread_id = None
+    #: The render task, with `async with`.
+    __task = None
 
     def __init__(
         self,
@@ -84,82 +91,98 @@ class Spinner:
         type: Optional[str] = "dots",
         cursor: Optional[bool] = False,
         color: Optional[str] = None,
+        live: Optional[Any] = None,
     ):
 
         self.text = text
         self.type = type
         self.stream = sys.stdout
         self.color = color
+        self.live = live
+        self.line = None
 
         if self.color and COLOR_SUPPORTED == False:
             raise SpinnerError(
                 "Colors are not supported. Install using `pip install hypecli[color]`"
             )
 
-        if cursor == False:
+        if cursor == False and live is None:
             hide_cursor()
 
-    def render(self):
+    @property
+    def interval(self) -> float:
+        """
+        The interval between two frames, in seconds.
         """
-        Render the spinner to the terminal
+        return 0.001 * SpinnerType[self.type]["interval"]
+
+    def frame(self) -> str:
+        """
+        Return the next frame of the spinner. Called by the render scheduler.
+        In a live region, the line of the spinner is updated instead.
         """
+        if self.color:
+            output = "{0}{1}{2} {3}".format(
+                rule_colors[self.color],
+                next(self.__frames),
+                rule_colors["reset"],
+                self.text,
+            )
+        else:
+            output = "{0} {1}".format(next(self.__frames), self.text)
+
+        if self.live is not None:
+            self.live.update(self.line, output)
+            return ""
+
+        return "\r" + output + "\033[K"  #: Clear the rest of the line
+
+    def __prepare(self):
         if self.type not in SpinnerType.keys():
             raise SpinnerNotFound("%s is not supported." % (self.type))
 
-        frames = SpinnerType[self.type]["frames"]
-        interval = 0.001 * SpinnerType[self.type]["interval"]
-        spinner = itertools.cycle(frames)
-
-        while not self.__stop_event.set():
+        self.__frames = itertools.cycle(SpinnerType[self.type]["frames"])
 
-            if self.color:
-                output = "\r{0}{1}{2} {3}".format(
-                    rule_colors[self.color],
-                    next(spinner),
-                    rule_colors["reset"],
-                    self.text,
-                )
-            else:
-                output = "\r{0} {1}".format(next(spinner), self.text)
+        if self.live is not None and self.line is None:
+            self.line = self.live.add()
 
-            self.stream.write(output)
-            self.stream.write("\033[K")  #: Clear line
-            self.stream.flush()
-            self.stream.write("\b")
-            time.sleep(interval)
+    def render(self):
+        """
+        Render the spinner to the terminal. The spinners of the process
+        are rendered by a single thread, see `hype.ui.scheduler`.
+        """
+        self.__prepare()
+        scheduler.add(self)
 
         return self
 
     @property
     def id(self):
         """
-        Get the thread id. For some purposes..
+        Get the name of the render thread, None when the spinner is stopped.
         """
-        return self.__thread_id
-
-    @id.setter
-    def id(self, value):
-        return value
+        thread = scheduler.thread
+        return thread.name if thread and self.__frames else None
 
     def start(self):
 
-        self.__thread = threading.Thread(target=self.render)
-        self.__stop_event = threading.Event()
-        self.__thread_id = self.__thread.name
-        self.__thread.setDaemon(True)
-        self.__thread.start()
-
-        return self
+        return self.render()
 
     def stop(self):
-        """Stop the thread on running"""
+        """Stop rendering the spinner"""
+
+        scheduler.remove(self)
+        self.__frames = None
 
-        if self.__thread and self.__thread.is_alive():
-            self.__stop_event.set()
+        if self.live is not None:
+            #: The line is dropped when the region is redrawn.
+            self.live.remove(self.line)
+            self.line = None
+            return self
 
         self.stream.write("\r")
         self.stream.write("\033[K")  #: Clear line
-        self.id = None
+        self.stream.flush()
         show_cursor()
         return self
 
@@ -172,3 +195,22 @@ class Spinner:
         """When the `with` statement ends"""
 
         return self.stop()
+
+    async def __aenter__(self):
+        """When the `async with` statement opens."""
+        import asyncio
+
+        self.__prepare()
+        self.__task = asyncio.ensure_future(animate(self))
+
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        """When the `async with` statement ends"""
+
+        task, self.__task = self.__task, None
+
+        try:
+            await cancel(task)
+        finally:
+            self.stop()
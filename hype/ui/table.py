@@ -33,6 +33,16 @@ except ModuleNotFoundError:
     tabulate = None
 
 
+def render_table(rows: List[Any], headers: Any, tablefmt: str) -> str:
+    """
+    Render the table with tabulate. The escape sequences of the colored
+    cells are not counted by tabulate, and the east asian wide characters
+    are measured by their displayed width when wcwidth is installed (it
+    is installed with `hypecli[table]`).
+    """
+    return tabulate(rows, headers=headers, tablefmt=tablefmt)
+
+
 class Table:
     """
     A table wrapper for `tabulate`
@@ -149,9 +159,7 @@ class Table:
                 table = parse_color(
                     "[bg color={0}]{1}[/bg]".format(
                         background_color,
-                        tabulate(
-                            self.__rows, headers=self.__headers, tablefmt=self.__type
-                        ),
+                        render_table(self.__rows, self.__headers, self.__type),
                     )
                 )
 
@@ -165,9 +173,7 @@ class Table:
 
         else:
             try:
-                table = tabulate(
-                    self.__rows, headers=self.__headers, tablefmt=self.__type
-                )
+                table = render_table(self.__rows, self.__headers, self.__type)
             except AttributeError:
                 raise PluginError(
                     "Table plugin is not supported. Read the docs for more info"
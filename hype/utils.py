@@ -21,6 +21,7 @@
 from typing import Optional
 from typing import Any
 from typing import Callable
+import importlib
 import inspect
 import typing
 
@@ -39,22 +40,32 @@ def convert_option_to_string(option: str = None) -> str:
     return option.split("--")[1]
 
 
-def create_bool_option(option: str = None) -> str:
+def import_string(path: str = None) -> Any:
     """
-    Create --formal / --no-formal
-    #: --no-formal is currently not avaialable. Just incase on future.
+    Import the object from an import path `package.module:attribute`
     """
-    if option.startswith("--"):
-        option = convert_option_to_string(option)
+    module_name, _, attribute = path.partition(":")
+    obj = importlib.import_module(module_name)
 
-    else:
-        option = option
+    for name in attribute.split("."):
+        obj = getattr(obj, name)
+
+    return obj
+
+
+def create_bool_option(option: str = None) -> str:
+    """
+    Create --formal / --no-formal (-f / --no-f for a single char option)
+    """
+    option = option.lstrip("-")
 
-    return ("--%s" % (option), "--no-%s" % (option))
+    return (convert_param_to_option(option), "--no-%s" % (option))
 
 
 class ParamOption:
 
+    __slots__ = ("name", "required", "default", "type", "action", "dest", "metavar")
+
     __metavar_mapping = {
         str: "STRING",
         int: "INTEGER",
@@ -105,8 +116,42 @@ class ParamOption:
             "action": self.action,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ParamOption":
+        """
+        Create the option from a `to_dict` value, as is.
+        """
+        option = cls.__new__(cls)
+
+        for name in cls.__slots__:
+            setattr(option, name, data[name])
+
+        return option
+
+
+class ArgumentDict:
+
+    __slots__ = ("name", "type", "help")
+
+    def __init__(self, name: str = None, type: type = None, help: str = None):
+
+        self.name = name
+        self.type = type
+        self.help = help
+
+    @property
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "type": self.type,
+            "help": self.help,
+        }
+
 
 class OptionDict:
+
+    __slots__ = ("name", "default", "required", "type")
+
     def __init__(
         self,
         name: str = None,
@@ -131,6 +176,19 @@ class OptionDict:
 
 
 class CommandDict:
+
+    __slots__ = (
+        "name",
+        "usage",
+        "help",
+        "aliases",
+        "opt",
+        "func",
+        "target",
+        "group",
+        "arguments",
+    )
+
     def __init__(
         self,
         name: str,
@@ -139,6 +197,9 @@ class CommandDict:
         aliases: tuple = None,
         opt: list = [],
         func: Callable[..., Any] = None,
+        target: str = None,
+        group: str = None,
+        arguments: list = None,
     ):
 
         self.name = name
@@ -147,6 +208,9 @@ class CommandDict:
         self.aliases = aliases
         self.opt = opt
         self.func = func
+        self.target = target
+        self.group = group
+        self.arguments = arguments
 
     @property
     def to_dict(self):
@@ -157,4 +221,45 @@ class CommandDict:
             "aliases": self.aliases,
             "options": self.opt,
             "func": self.func,
+            "target": self.target,
+            "group": self.group,
+            "arguments": self.arguments,
         }
+
+
+class InvokeResult:
+    """
+    The result of `Hype.invoke`.
+
+    Parameters:
+    ---
+        exit_code (int):
+            The exit code, 0 if the command returned.
+
+        result (Any):
+            The value returned by the command function, None if it exited.
+
+        stdout (str):
+            The captured output, None if it was written to a stream.
+
+        stderr (str):
+            The captured errors, None if they were written to a stream.
+    """
+
+    __slots__ = ("exit_code", "result", "stdout", "stderr")
+
+    def __init__(
+        self,
+        exit_code: int,
+        result: Any = None,
+        stdout: Optional[str] = None,
+        stderr: Optional[str] = None,
+    ):
+
+        self.exit_code = exit_code
+        self.result = result
+        self.stdout = stdout
+        self.stderr = stderr
+
+    def __repr__(self):
+        return "InvokeResult(exit_code=%r, result=%r)" % (self.exit_code, self.result)
@@ -37,7 +37,7 @@ extras_require = {
     'color': ['colorama==0.4.4'], #: Color support
     'standard': ['colorama==0.4.4'], #: Standard installation with color support
     'progress': ['alive-progress==1.6.2'], #: With progressbar support
-    'table': ['tabulate==0.8.9'] #: With Table support
+    'table': ['tabulate==0.8.9', 'wcwidth'] #: With Table support (wcwidth measures the wide characters)
 }
 
 
@@ -59,6 +59,9 @@ setup(
     keywords='cli,commandline-toolkit,command line toolkit,python cli,python 3'.split(','),
     packages = [p for p in find_packages() if 'test' not in p],
     extras_require = extras_require,
+    entry_points = {
+        'console_scripts': ['hype=hype.__main__:main']
+    },
     classifiers = [
         "Intended Audience :: Information Technology",
         "Intended Audience :: System Administrators",